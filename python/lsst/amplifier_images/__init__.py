@@ -19,6 +19,9 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import importlib as _importlib
+from typing import Any as _Any, List as _List
+
 from .version import *  # Generated by sconsUtils
 
 # ABC for image manipulation primitives.
@@ -34,7 +37,54 @@ from ._amplifier_set import *
 from ._trimmed_amplifier_sets import *
 from ._untrimmed_amplifier_sets import *
 
-# Implementations for image manipulation primitives.
-from ._box_only import *
-from ._afw import *
-from ._numpy import *
+# Implementations for image manipulation primitives are imported on first
+# use (PEP 562), so code that only needs one backend doesn't pay for the
+# others.  The ABCs above import them lazily, too.
+_LAZY_MODULES = {
+    "BoxOnlyImageSection": "_box_only",
+    "AfwImageLike": "_afw",
+    "AfwImageSection": "_afw",
+    "AfwMaskedImageSection": "_afw",
+    "AfwSingleImageSection": "_afw",
+    "NumPyImageSection": "_numpy",
+}
+
+# Without this, a star import of this package would skip the lazy names;
+# listing them makes it resolve them through __getattr__ instead.  The
+# eager names come from the submodules' own __all__, so incidental
+# attributes (such as the version submodule) are not exported.
+from . import (
+    _amplifier,
+    _amplifier_set,
+    _image_section,
+    _trimmed_amplifier,
+    _trimmed_amplifier_sets,
+    _untrimmed_amplifier,
+    _untrimmed_amplifier_sets,
+)
+
+__all__ = (
+    _image_section.__all__
+    + _amplifier.__all__
+    + _trimmed_amplifier.__all__
+    + _untrimmed_amplifier.__all__
+    + _amplifier_set.__all__
+    + _trimmed_amplifier_sets.__all__
+    + _untrimmed_amplifier_sets.__all__
+    + tuple(_LAZY_MODULES)
+)
+
+
+def __getattr__(name: str) -> _Any:
+    try:
+        module_name = _LAZY_MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(_importlib.import_module(f".{module_name}", __name__), name)
+    # Cache in the module namespace so later lookups bypass __getattr__.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> _List[str]:
+    return sorted(set(globals()) | _LAZY_MODULES.keys())
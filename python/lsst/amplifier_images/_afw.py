@@ -24,16 +24,22 @@ from __future__ import annotations
 __all__ = (
     "AfwImageLike",
     "AfwImageSection",
+    "AfwMaskedImageSection",
+    "AfwSingleImageSection",
 )
 
-from typing import Optional, Protocol, TypeVar
+from typing import Any, Iterable, Optional, Protocol, Tuple, Type, TypeVar
 
-from lsst.geom import Box2I, PointI
+import numpy as np
+
+from lsst.geom import Box2I, ExtentI, PointI
 
 from ._image_section import (
     ImageSection,
     ImageSectionTransform,
 )
+from ._kernels import copy_flipped, flip_copy
+from ._numpy import NumPyImageSection
 
 
 _S = TypeVar("_S")
@@ -45,8 +51,9 @@ class AfwImageLike(Protocol):
 
     This simply provides a bit of static type checking by declaring the common
     interface of `lsst.afw.image.Image` and `lsst.afw.image.MaskedImage` that
-    we care about here.  It isn't quite complete, as we also use
-    `lsst.afw.math.flipImage`, and that isn't a method.
+    we care about here.  It isn't quite complete, as we also use the
+    ``array`` attribute of single-plane images and the ``image``, ``mask``,
+    and ``variance`` attributes of masked images.
     """
 
     def __init__(
@@ -75,15 +82,111 @@ class AfwImageSection(ImageSection[_V]):
     ----------
     image : `lsst.afw.image.Image` or `lsst.afw.image.MaskedImage`
         Image to adapt.
+
+    Notes
+    -----
+    Constructing an `AfwImageSection` directly returns an instance of one of
+    its subclasses, `AfwSingleImageSection` (for `lsst.afw.image.Image` and
+    other types with a single ``array`` plane) or `AfwMaskedImageSection` (for
+    `lsst.afw.image.MaskedImage`), which know how many pixel planes they hold
+    and can move pixels directly via NumPy without inspecting the image type.
     """
 
+    __slots__ = ("_image", "_bbox", "_cls", "_coords")
+
+    def __new__(cls, image: Optional[_V] = None) -> AfwImageSection[_V]:
+        # ``image`` may be omitted when an instance of a concrete subclass is
+        # being recreated without __init__ (e.g. by copy or pickle).
+        if cls is AfwImageSection and image is not None:
+            cls = cls._subclass_for(image)
+        return super().__new__(cls)
+
+    @staticmethod
+    def _subclass_for(image: _V) -> Type[AfwImageSection]:
+        """Return the concrete subclass that adapts the given image's type.
+
+        Parameters
+        ----------
+        image : `lsst.afw.image.Image` or `lsst.afw.image.MaskedImage`
+            Image to inspect.
+
+        Returns
+        -------
+        section_cls : `type`
+            `AfwSingleImageSection` or `AfwMaskedImageSection`.
+        """
+        return AfwSingleImageSection if hasattr(image, "array") else AfwMaskedImageSection
+
     def __init__(self, image: _V):
         self._image = image
+        self._bbox = image.getBBox()
+        self._cls = type(image)
+        self._coords: Optional[Tuple[int, int, int, int]] = None
+
+    @classmethod
+    def _with_bbox(cls, image: _V, bbox: Box2I) -> AfwImageSection[_V]:
+        """Construct from an image whose bounding box is already known.
+
+        This must only be called on a concrete subclass that matches the type
+        of ``image``.
+
+        Parameters
+        ----------
+        image : `lsst.afw.image.Image` or `lsst.afw.image.MaskedImage`
+            Image to adapt.
+        bbox : `Box2I`
+            Bounding box of ``image``; must be equal to ``image.getBBox()``.
+
+        Returns
+        -------
+        section : `AfwImageSection`
+            New image section.
+        """
+        self = super().__new__(cls)
+        self._image = image
+        self._bbox = bbox
+        self._cls = type(image)
+        self._coords = None
+        return self
+
+    @classmethod
+    def from_array(cls, array: np.ndarray, xy0: PointI, image_cls: Any = None) -> AfwSingleImageSection:
+        """Construct from a NumPy array, without copying its pixels.
+
+        Parameters
+        ----------
+        array : `numpy.ndarray`
+            2-d array of pixel values.  Rows must be contiguous, since afw
+            images cannot have negative or non-unit column strides.
+        xy0 : `PointI`
+            Minimum point of the image's bounding box.
+        image_cls : `type`, optional
+            Single-plane afw image class to construct; must be consistent with
+            ``array.dtype``.  Defaults to `lsst.afw.image.ImageF`.
+
+        Returns
+        -------
+        section : `AfwSingleImageSection`
+            An image section whose image shares pixels with ``array``.
+        """
+        if image_cls is None:
+            from lsst.afw.image import ImageF  # type: ignore
+
+            image_cls = ImageF
+        bbox = Box2I(xy0, ExtentI(array.shape[1], array.shape[0]))
+        return AfwSingleImageSection._with_bbox(image_cls(array, deep=False, xy0=xy0), bbox)
 
     @property
     def bbox(self) -> Box2I:
         # Docstring inherited.
-        return self._image.getBBox()
+        return self._bbox
+
+    @property
+    def coords(self) -> Tuple[int, int, int, int]:
+        # Docstring inherited.
+        if self._coords is None:
+            self._coords = super().coords
+        return self._coords
 
     @property
     def image(self) -> _V:
@@ -92,27 +195,196 @@ class AfwImageSection(ImageSection[_V]):
 
     def copy(self) -> AfwImageSection[_V]:
         # Docstring inherited.
-        return AfwImageSection(type(self._image)(self._image, deep=True))
+        return self._with_bbox(self._cls(self._image, deep=True), self._bbox)
 
     def make_empty(self, bbox: Box2I) -> AfwImageSection[_V]:
         # Docstring inherited.
-        return AfwImageSection(type(self._image)(bbox=bbox))
+        return self._with_bbox(self._cls(bbox=bbox), bbox)
 
     def subimage(self, bbox: Box2I) -> AfwImageSection[_V]:
         # Docstring inherited.
-        return AfwImageSection(type(self._image)(self._image, bbox=bbox))
+        if bbox == self._bbox:
+            return self
+        return self._with_bbox(self._cls(self._image, bbox=bbox), bbox)
+
+
+def _flip_plane(plane: Any, flip_y: bool, flip_x: bool, xy0: PointI) -> Any:
+    """Return a flipped deep copy of a single afw pixel plane.
+
+    Parameters
+    ----------
+    plane : `lsst.afw.image.Image` or `lsst.afw.image.Mask`
+        Plane to flip.
+    flip_y : `bool`
+        Whether to reverse the order of rows.
+    flip_x : `bool`
+        Whether to reverse the order of columns.
+    xy0 : `lsst.geom.PointI`
+        Minimum point of the returned plane.
+
+    Returns
+    -------
+    flipped : `lsst.afw.image.Image` or `lsst.afw.image.Mask`
+        New plane of the same type, with its own pixel buffer.
+    """
+    if hasattr(plane, "getMaskPlaneDict"):
+        # A mask built from a bare array gets the default plane dictionary,
+        # so copy-construct to keep this one's and flip into the copy.
+        flipped = type(plane)(plane, deep=True)
+        copy_flipped(flipped.array, 0, 0, plane.array, flip_y, flip_x)
+        flipped.setXY0(xy0)
+        return flipped
+    # afw images cannot have negative strides, so a flip always needs a new
+    # pixel buffer, but NumPy can fill it directly and afw can adopt it
+    # without another copy.
+    return type(plane)(flip_copy(plane.array, flip_y, flip_x), deep=False, xy0=xy0)
+
+
+class AfwSingleImageSection(AfwImageSection[_V]):
+    """An `AfwImageSection` for afw types with a single pixel plane, such as
+    `lsst.afw.image.Image`.
+
+    Parameters
+    ----------
+    image : `lsst.afw.image.Image`
+        Image to adapt.
+    """
+
+    __slots__ = ()
+
+    def to_numpy(self) -> NumPyImageSection:
+        """Return a `NumPyImageSection` that shares pixels with ``self``.
+
+        No pixels are copied, so this can be used to move a tight loop onto
+        the NumPy implementation and convert back once at the end.
+
+        Returns
+        -------
+        section : `NumPyImageSection`
+            NumPy-backed image section with the same bounding box.
+        """
+        return NumPyImageSection._with_bbox(self._image.array, self._bbox)
 
     def assign(self, other: ImageSection[_V]) -> None:
         # Docstring inherited.
-        self._image.assign(other.image, bbox=other.bbox)
+        if not isinstance(other, AfwSingleImageSection):
+            # Let afw deal with (or reject) mixed image types.
+            self._image.assign(other.image, bbox=other.bbox)
+            return
+        # Copy straight between the NumPy views, skipping afw's own box
+        # arithmetic and subimage construction.
+        src = other._image.array
+        dy, dx = self._offset_of(other.coords)
+        np.copyto(self._image.array[dy : dy + src.shape[0], dx : dx + src.shape[1]], src)  # noqa: E203
+
+    def assign_transformed(self, other: ImageSection[_V], transform: ImageSectionTransform) -> None:
+        # Docstring inherited.
+        if not isinstance(other, AfwSingleImageSection):
+            super().assign_transformed(other, transform)
+            return
+        dy, dx = self._offset_of(transform._output_coords)
+        copy_flipped(self._image.array, dy, dx, other._image.array, transform.flip_y, transform.flip_x)
+
+    def assign_many(self, others: Iterable[Tuple[ImageSection[_V], ImageSectionTransform]]) -> None:
+        # Docstring inherited.
+        dst = self._image.array
+        for other, transform in others:
+            if not isinstance(other, AfwSingleImageSection):
+                super().assign_transformed(other, transform)
+                continue
+            dy, dx = self._offset_of(transform._output_coords)
+            copy_flipped(dst, dy, dx, other._image.array, transform.flip_y, transform.flip_x)
 
     def apply_transform(self, transform: ImageSectionTransform, *, allow_view: bool) -> AfwImageSection[_V]:
         # Docstring inherited.
-        if not (transform.flip_x or transform.flip_y):
-            image = type(self._image)(self._image, deep=not allow_view)
+        if allow_view and transform.is_identity:
+            return self
+        xy0 = transform.output_bbox.getMin()
+        if transform.flip_x or transform.flip_y:
+            image = _flip_plane(self._image, transform.flip_y, transform.flip_x, xy0)
         else:
-            from lsst.afw.math import flipImage  # type: ignore
+            # With allow_view, this is a shallow view whose XY0 we can shift
+            # without affecting self.
+            image = self._cls(self._image, deep=not allow_view)
+            image.setXY0(xy0)
+        return self._with_bbox(image, transform.output_bbox)
+
 
-            image: AfwImageLike = flipImage(self._image, transform.flip_x, transform.flip_y)
-        image.setXY0(transform.output_bbox.getMin())
-        return AfwImageSection(image)
+class AfwMaskedImageSection(AfwImageSection[_V]):
+    """An `AfwImageSection` for `lsst.afw.image.MaskedImage`, with separate
+    image, mask, and variance planes.
+
+    Parameters
+    ----------
+    image : `lsst.afw.image.MaskedImage`
+        Image to adapt.
+    """
+
+    __slots__ = ()
+
+    def assign(self, other: ImageSection[_V]) -> None:
+        # Docstring inherited.
+        if not isinstance(other, AfwMaskedImageSection):
+            # Let afw deal with (or reject) mixed image types.
+            self._image.assign(other.image, bbox=other.bbox)
+            return
+        dst = self._image
+        src = other._image
+        height, width = src.image.array.shape
+        dy, dx = self._offset_of(other.coords)
+        rows = slice(dy, dy + height)
+        cols = slice(dx, dx + width)
+        np.copyto(dst.image.array[rows, cols], src.image.array)
+        np.copyto(dst.mask.array[rows, cols], src.mask.array)
+        np.copyto(dst.variance.array[rows, cols], src.variance.array)
+
+    def assign_transformed(self, other: ImageSection[_V], transform: ImageSectionTransform) -> None:
+        # Docstring inherited.
+        if not isinstance(other, AfwMaskedImageSection):
+            super().assign_transformed(other, transform)
+            return
+        dst = self._image
+        src = other._image
+        flip_y = transform.flip_y
+        flip_x = transform.flip_x
+        dy, dx = self._offset_of(transform._output_coords)
+        copy_flipped(dst.image.array, dy, dx, src.image.array, flip_y, flip_x)
+        copy_flipped(dst.mask.array, dy, dx, src.mask.array, flip_y, flip_x)
+        copy_flipped(dst.variance.array, dy, dx, src.variance.array, flip_y, flip_x)
+
+    def assign_many(self, others: Iterable[Tuple[ImageSection[_V], ImageSectionTransform]]) -> None:
+        # Docstring inherited.
+        dst_image = self._image.image.array
+        dst_mask = self._image.mask.array
+        dst_variance = self._image.variance.array
+        for other, transform in others:
+            if not isinstance(other, AfwMaskedImageSection):
+                super().assign_transformed(other, transform)
+                continue
+            src = other._image
+            flip_y = transform.flip_y
+            flip_x = transform.flip_x
+            dy, dx = self._offset_of(transform._output_coords)
+            copy_flipped(dst_image, dy, dx, src.image.array, flip_y, flip_x)
+            copy_flipped(dst_mask, dy, dx, src.mask.array, flip_y, flip_x)
+            copy_flipped(dst_variance, dy, dx, src.variance.array, flip_y, flip_x)
+
+    def apply_transform(self, transform: ImageSectionTransform, *, allow_view: bool) -> AfwImageSection[_V]:
+        # Docstring inherited.
+        if allow_view and transform.is_identity:
+            return self
+        xy0 = transform.output_bbox.getMin()
+        if transform.flip_x or transform.flip_y:
+            # Flip each plane into a new buffer and reassemble them.
+            image = self._cls(
+                *[
+                    _flip_plane(plane, transform.flip_y, transform.flip_x, xy0)
+                    for plane in (self._image.image, self._image.mask, self._image.variance)
+                ]
+            )
+        else:
+            # With allow_view, this is a shallow view whose XY0 we can shift
+            # without affecting self.
+            image = self._cls(self._image, deep=not allow_view)
+            image.setXY0(xy0)
+        return self._with_bbox(image, transform.output_bbox)
@@ -36,7 +36,56 @@ _T = TypeVar("_T")
 
 
 class Amplifier(Generic[_T]):
-    """An image that corresponds to a single amplifier."""
+    """An image that corresponds to a single amplifier.
+
+    Notes
+    -----
+    Simple metadata (everything that is not itself a transformation of the
+    amplifier) is held in plain instance attributes that are populated by the
+    concrete subclass constructors, rather than properties.  These attributes
+    must not be modified after construction.
+    """
+
+    __slots__ = ()
+
+    amplifier_id: int
+    """Integer ID for this amplifier (`int`)."""
+
+    data: ImageSection[_T]
+    """Data section for the amplifier (`ImageSection`)."""
+
+    readout_transform: ImageSectionTransform
+    """Tranform that maps this amplifier into readout coordinates
+    (`ImageSectionTransform`).
+
+    In readout coordinates, rows and columns are always ordered consistently
+    with the order in which they are read out, the origin of the full
+    untrimmed amplifier image is (0, 0).
+    """
+
+    horizontal_overscan_boundary: int
+    """The x coordinate of the boundary of the data region that is adjacent to
+    the horizontal overscan region (`int`).
+
+    This is always equal to either ``self.data.bbox.getMinX()`` or
+    ``self.data.bbox.getMaxX()``.
+    """
+
+    vertical_overscan_boundary: int
+    """The y coordinate of the boundary of the data region that is adjacent to
+    the horizontal overscan region (`int`).
+
+    This is always equal to either ``self.data.bbox.getMinY()`` or
+    ``self.data.bbox.getMaxY()``.
+    """
+
+    horizontal_prescan_boundary: int
+    """The x coordinate of the boundary of the data region that is adjacent to
+    the horizontal prescan region (`int`).
+
+    This is always equal to either ``self.data.bbox.getMinX()`` or
+    ``self.data.bbox.getMaxX()``.
+    """
 
     @abstractmethod
     def copy(self) -> Amplifier[_T]:
@@ -61,18 +110,6 @@ class Amplifier(Generic[_T]):
         """
         raise NotImplementedError()
 
-    @property
-    @abstractmethod
-    def amplifier_id(self) -> int:
-        """Integer ID for this amplifier (`int`)."""
-        raise NotImplementedError()
-
-    @property
-    @abstractmethod
-    def data(self) -> ImageSection[_T]:
-        """Data section for the amplifier (`ImageSection`)."""
-        raise NotImplementedError()
-
     @property
     @abstractmethod
     def trimmed_view(self) -> TrimmedAmplifier[_T]:
@@ -83,18 +120,6 @@ class Amplifier(Generic[_T]):
         """
         raise NotImplementedError()
 
-    @property
-    @abstractmethod
-    def readout_transform(self) -> ImageSectionTransform:
-        """Tranform that maps this amplifier into readout coordinates
-        (`ImageSectionTransform`).
-
-        In readout coordinates, rows and columns are always ordered
-        consistently with the order in which they are read out, the origin
-        of the full untrimmed amplifier image is (0, 0).
-        """
-        raise NotImplementedError()
-
     @abstractmethod
     def into_readout_coordinates(self, *, allow_view: bool = False) -> Amplifier[_T]:
         """Return a new `Amplifier` with the same trim state that is guaranteed
@@ -110,36 +135,3 @@ class Amplifier(Generic[_T]):
             returned probably isn't instrument-generic.
         """
         raise NotImplementedError()
-
-    @property
-    @abstractmethod
-    def horizontal_overscan_boundary(self) -> int:
-        """The x coordinate of the boundary of the data region that is adjacent
-        to the horizontal overscan region.
-
-        This is always equal to either ``self.data.bbox.getMinX()`` or
-        ``self.data.bbox.getMaxX()``.
-        """
-        raise NotImplementedError()
-
-    @property
-    @abstractmethod
-    def vertical_overscan_boundary(self) -> int:
-        """The y coordinate of the boundary of the data region that is adjacent
-        to the horizontal overscan region.
-
-        This is always equal to either ``self.data.bbox.getMinY()`` or
-        ``self.data.bbox.getMaxY()``.
-        """
-        raise NotImplementedError()
-
-    @property
-    @abstractmethod
-    def horizontal_prescan_boundary(self) -> int:
-        """The x coordinate of the boundary of the data region that is adjacent
-        to the horizontal prescan region.
-
-        This is always equal to either ``self.data.bbox.getMinX()`` or
-        ``self.data.bbox.getMaxX()``.
-        """
-        raise NotImplementedError()
@@ -21,12 +21,21 @@
 
 from __future__ import annotations
 
-__all__ = ("AmplifierSet",)
+__all__ = (
+    "AmplifierSet",
+    "AmplifierSetArrays",
+)
 
 from abc import abstractmethod
-from typing import Any, Generic, Iterator, TypeVar, TYPE_CHECKING
+import bisect
+import dataclasses
+import operator
+from typing import Any, Generic, Iterable, Iterator, Optional, Tuple, TypeVar, TYPE_CHECKING
+
+import numpy as np
 
 from ._amplifier import Amplifier
+from ._image_section import _box_coords
 
 if TYPE_CHECKING:
     from ._trimmed_amplifier_sets import (
@@ -48,6 +57,160 @@ class IncompleteAmplifierSetError(RuntimeError):
         )
 
 
+_A = TypeVar("_A", bound=Amplifier)
+
+
+def _sort_amplifiers(amplifiers: Iterable[_A]) -> Tuple[Tuple[_A, ...], Tuple[int, ...], Optional[int]]:
+    """Sort amplifiers by ID for storage in an `AmplifierSet`.
+
+    Parameters
+    ----------
+    amplifiers : `Iterable` [ `Amplifier` ]
+        Amplifiers to sort.  Single-pass iterators are permitted.
+
+    Returns
+    -------
+    sorted_amplifiers : `tuple` [ `Amplifier` ]
+        Amplifiers, sorted by ID.
+    ids : `tuple` [ `int` ]
+        Sorted amplifier IDs, parallel to ``sorted_amplifiers``.
+    id_offset : `int` or `None`
+        If the IDs are contiguous (the usual case), the first ID, so that the
+        amplifier with ID ``i`` is at index ``i - id_offset``.  `None`
+        otherwise.
+
+    Raises
+    ------
+    ValueError
+        Raised if two amplifiers have the same ID.
+    """
+    sorted_amplifiers = tuple(sorted(amplifiers, key=operator.attrgetter("amplifier_id")))
+    ids = tuple(amp.amplifier_id for amp in sorted_amplifiers)
+    for a, b in zip(ids[:-1], ids[1:]):
+        if a == b:
+            raise ValueError(f"Multiple amplifiers with ID {a}.")
+    if ids and ids[-1] - ids[0] == len(ids) - 1:
+        # Sorted and unique, so this means there are no gaps.
+        return sorted_amplifiers, ids, ids[0]
+    return sorted_amplifiers, ids, None
+
+
+def _find_amplifier(
+    amplifiers: Tuple[_A, ...], ids: Tuple[int, ...], id_offset: Optional[int], amplifier_id: int
+) -> _A:
+    """Look up an amplifier in the storage returned by `_sort_amplifiers`.
+
+    Raises
+    ------
+    KeyError
+        Raised if there is no amplifier with the given ID.
+    """
+    if id_offset is not None:
+        index = amplifier_id - id_offset
+        if 0 <= index < len(amplifiers):
+            return amplifiers[index]
+    else:
+        index = bisect.bisect_left(ids, amplifier_id)
+        if index < len(ids) and ids[index] == amplifier_id:
+            return amplifiers[index]
+    raise KeyError(amplifier_id)
+
+
+@dataclasses.dataclass(frozen=True)
+class AmplifierSetArrays:
+    """Per-amplifier metadata for all amplifiers in an `AmplifierSet`, held in
+    parallel arrays.
+
+    Notes
+    -----
+    Row ``i`` of each array corresponds to the ``i``-th amplifier in the set's
+    iteration order.  Bounding boxes are stored as ``(N, 4)`` arrays whose
+    columns are ``(min_x, min_y, max_x, max_y)``.  The arrays are read-only,
+    since they may be shared by several sets with the same amplifiers.
+    """
+
+    amplifier_id: np.ndarray
+    """Integer amplifier IDs (`numpy.ndarray`, `numpy.int32`, shape ``(N,)``).
+    """
+
+    bbox: np.ndarray
+    """Bounding boxes of the amplifier images in their current coordinates,
+    i.e. the input boxes of their readout transforms (`numpy.ndarray`,
+    `numpy.int32`, shape ``(N, 4)``).
+
+    For untrimmed amplifiers these include the overscan and prescan regions;
+    for trimmed amplifiers they are the same as `data_bbox`.
+    """
+
+    data_bbox: np.ndarray
+    """Bounding boxes of the data sections (`numpy.ndarray`, `numpy.int32`,
+    shape ``(N, 4)``).
+    """
+
+    flip_x: np.ndarray
+    """Whether the readout transform of each amplifier flips the x axis
+    (`numpy.ndarray`, `bool`, shape ``(N,)``).
+    """
+
+    flip_y: np.ndarray
+    """Whether the readout transform of each amplifier flips the y axis
+    (`numpy.ndarray`, `bool`, shape ``(N,)``).
+    """
+
+    horizontal_overscan_boundary: np.ndarray
+    """See `Amplifier.horizontal_overscan_boundary` (`numpy.ndarray`,
+    `numpy.int32`, shape ``(N,)``).
+    """
+
+    vertical_overscan_boundary: np.ndarray
+    """See `Amplifier.vertical_overscan_boundary` (`numpy.ndarray`,
+    `numpy.int32`, shape ``(N,)``).
+    """
+
+    horizontal_prescan_boundary: np.ndarray
+    """See `Amplifier.horizontal_prescan_boundary` (`numpy.ndarray`,
+    `numpy.int32`, shape ``(N,)``).
+    """
+
+    @classmethod
+    def from_amplifiers(cls, amplifiers: Iterable[Amplifier[Any]]) -> AmplifierSetArrays:
+        """Construct from an iterable of amplifiers.
+
+        Parameters
+        ----------
+        amplifiers : `Iterable` [ `Amplifier` ]
+            Amplifiers to extract metadata from.  Single-pass iterators are
+            permitted.
+
+        Returns
+        -------
+        arrays : `AmplifierSetArrays`
+            Parallel arrays of amplifier metadata.
+        """
+        amplifiers = list(amplifiers)
+        result = cls(
+            amplifier_id=np.array([amp.amplifier_id for amp in amplifiers], dtype=np.int32),
+            bbox=np.array(
+                [_box_coords(amp.readout_transform.input_bbox) for amp in amplifiers], dtype=np.int32
+            ).reshape(-1, 4),
+            data_bbox=np.array([amp.data.coords for amp in amplifiers], dtype=np.int32).reshape(-1, 4),
+            flip_x=np.array([amp.readout_transform.flip_x for amp in amplifiers], dtype=bool),
+            flip_y=np.array([amp.readout_transform.flip_y for amp in amplifiers], dtype=bool),
+            horizontal_overscan_boundary=np.array(
+                [amp.horizontal_overscan_boundary for amp in amplifiers], dtype=np.int32
+            ),
+            vertical_overscan_boundary=np.array(
+                [amp.vertical_overscan_boundary for amp in amplifiers], dtype=np.int32
+            ),
+            horizontal_prescan_boundary=np.array(
+                [amp.horizontal_prescan_boundary for amp in amplifiers], dtype=np.int32
+            ),
+        )
+        for field in dataclasses.fields(result):
+            getattr(result, field.name).flags.writeable = False
+        return result
+
+
 class AmplifierSet(Generic[_T]):
     """A container for amplifiers.
 
@@ -56,8 +219,31 @@ class AmplifierSet(Generic[_T]):
     This is not guaranteed to include all amplifiers for a detector, but it can
     only hold amplifiers that are from the same detector.  It makes no
     guarantees about trim state or orientation (its subclasses generally do).
+
+    Simple metadata is held in plain instance attributes that are populated by
+    the concrete subclass constructors, rather than properties.  These
+    attributes must not be modified after construction.
     """
 
+    __slots__ = ("_arrays",)
+
+    observation_info: Any
+    """Additional information describing an observation that is the same for
+    all amplifiers in a detector.
+
+    The type of this attribute is unspecified as it is simply passed through as
+    a black box through various `AmplifierSet` methods (e.g. assembly).  The
+    ``astro_metadata_translator`` package's `ObservationInfo` is a natural
+    candidate, and the inspiration for the name.
+    """
+
+    is_complete: bool
+    """`True` if this set contains all amplifiers for a single detector, and
+    `False` otherwise (`bool`).
+    """
+
+    _arrays: Optional[AmplifierSetArrays]
+
     @abstractmethod
     def __getitem__(self, amplifier_id: int) -> Amplifier[_T]:
         raise NotImplementedError()
@@ -71,18 +257,15 @@ class AmplifierSet(Generic[_T]):
         raise NotImplementedError()
 
     @property
-    @abstractmethod
-    def observation_info(self) -> Any:
-        """Additional information describing an observation that is the same
-        for all amplifiers in a detector.
-
-        The type of this attribute is unspecified as it is simply passed
-        through as a black box through various `AmplifierSet` methods (e.g.
-        assembly).  The ``astro_metadata_translator`` package's
-        `ObservationInfo` is a natural candidate, and the inspiration for the
-        name.
+    def arrays(self) -> AmplifierSetArrays:
+        """Metadata for all amplifiers in the set as parallel NumPy arrays
+        (`AmplifierSetArrays`).
+
+        This is computed on first access and cached.
         """
-        raise NotImplementedError()
+        if self._arrays is None:
+            self._arrays = AmplifierSetArrays.from_amplifiers(self)
+        return self._arrays
 
     @abstractmethod
     def copy(self) -> AmplifierSet[_T]:
@@ -96,14 +279,6 @@ class AmplifierSet(Generic[_T]):
         """
         raise NotImplementedError()
 
-    @property
-    @abstractmethod
-    def is_complete(self) -> bool:
-        """`True` if this set contains all amplifiers for a single detector,
-        and `False` otherwise.
-        """
-        raise NotImplementedError()
-
     @property
     @abstractmethod
     def trimmed_view(self) -> TrimmedAmplifierSet[_T]:
@@ -24,11 +24,22 @@ from __future__ import annotations
 __all__ = ("BoxOnlyImageSection",)
 
 
+from typing import Iterable, Optional, Tuple
+
 from lsst.geom import Box2I
 
 from ._image_section import ImageSection, ImageSectionTransform
 
 
+_CHECK_BOXES = False
+"""Whether `BoxOnlyImageSection` should check that the boxes passed to its
+methods are consistent with its own (`bool`).
+
+These checks are the only work most of its methods do, so they are disabled
+by default; enable them when debugging layout problems.
+"""
+
+
 class BoxOnlyImageSection(ImageSection[None]):
     """An `ImageSection` implementation with no image payload, just a
     bounding box.
@@ -39,14 +50,24 @@ class BoxOnlyImageSection(ImageSection[None]):
         Bounding box for this image section.
     """
 
+    __slots__ = ("_bbox", "_coords")
+
     def __init__(self, bbox: Box2I):
         self._bbox = bbox
+        self._coords: Optional[Tuple[int, int, int, int]] = None
 
     @property
     def bbox(self) -> Box2I:
         # Docstring inherited.
         return self._bbox
 
+    @property
+    def coords(self) -> Tuple[int, int, int, int]:
+        # Docstring inherited.
+        if self._coords is None:
+            self._coords = super().coords
+        return self._coords
+
     @property
     def image(self) -> None:
         # Docstring inherited.
@@ -64,14 +85,32 @@ class BoxOnlyImageSection(ImageSection[None]):
 
     def subimage(self, bbox: Box2I) -> BoxOnlyImageSection:
         # Docstring inherited.
-        assert self.bbox.contains(bbox)
+        if _CHECK_BOXES:
+            assert self._bbox.contains(bbox)
         return BoxOnlyImageSection(bbox)
 
     def assign(self, other: ImageSection[None]) -> None:
         # Docstring inherited.
-        assert self.bbox.contains(other.bbox)
+        if _CHECK_BOXES:
+            assert self._bbox.contains(other.bbox)
+
+    def assign_transformed(self, other: ImageSection[None], transform: ImageSectionTransform) -> None:
+        # Docstring inherited.
+        if _CHECK_BOXES:
+            assert transform.input_bbox == other.bbox
+            assert self._bbox.contains(transform.output_bbox)
+
+    def assign_many(self, others: Iterable[Tuple[ImageSection[None], ImageSectionTransform]]) -> None:
+        # Docstring inherited.
+        if _CHECK_BOXES:
+            for other, transform in others:
+                self.assign_transformed(other, transform)
 
     def apply_transform(self, transform: ImageSectionTransform, *, allow_view: bool) -> BoxOnlyImageSection:
         # Docstring inherited.
-        assert transform.input_bbox == self._bbox
+        if _CHECK_BOXES:
+            assert transform.input_bbox == self._bbox
+        if transform.is_identity:
+            # Boxes are never modified, so a "copy" may be self, too.
+            return self
         return BoxOnlyImageSection(transform.output_bbox)
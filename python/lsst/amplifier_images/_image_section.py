@@ -28,17 +28,50 @@ __all__ = (
 
 from abc import abstractmethod
 import dataclasses
-from typing import cast, Generic, TypeVar
+import functools
+from typing import Any, Callable, Dict, Generic, Iterable, List, Tuple, TypeVar
 
 import numpy as np
 
-from lsst.geom import Box2I, ExtentI
+from lsst.geom import Box2I, PointI
 
 
 _T = TypeVar("_T")
 _U = TypeVar("_U")
 
 
+def _box_coords(bbox: Box2I) -> Tuple[int, int, int, int]:
+    """Return the minimum x, minimum y, maximum x, and maximum y of a box."""
+    return (bbox.getMinX(), bbox.getMinY(), bbox.getMaxX(), bbox.getMaxY())
+
+
+def _tiling_of_outputs(transforms: Iterable[ImageSectionTransform]) -> Tuple[Box2I, bool]:
+    """Return the smallest box that contains the output boxes of all of the
+    given transforms, which must not be empty, and whether those boxes cover
+    every pixel in it exactly once.
+    """
+    coords = sorted(transform._output_coords for transform in transforms)
+    min_x = min(c[0] for c in coords)
+    min_y = min(c[1] for c in coords)
+    max_x = max(c[2] for c in coords)
+    max_y = max(c[3] for c in coords)
+    bbox = Box2I(minimum=PointI(min_x, min_y), maximum=PointI(max_x, max_y))
+    area = sum((c[2] - c[0] + 1) * (c[3] - c[1] + 1) for c in coords)
+    if area != (max_x - min_x + 1) * (max_y - min_y + 1):
+        return bbox, False
+    # Equal areas only prove exact coverage if no two boxes overlap (an
+    # overlap could hide a gap of the same size).  The boxes are sorted by
+    # minimum x, so each one only needs to be compared to the later boxes that
+    # start before it ends in x.
+    for i, (a_min_x, a_min_y, a_max_x, a_max_y) in enumerate(coords):
+        for b_min_x, b_min_y, b_max_x, b_max_y in coords[i + 1:]:
+            if b_min_x > a_max_x:
+                break
+            if b_min_y <= a_max_y and a_min_y <= b_max_y:
+                return bbox, False
+    return bbox, True
+
+
 class ImageSection(Generic[_T]):
     """An abstract interface that provides access to at least a bounding box,
     and possibly some kind of image data associated with it.
@@ -51,6 +84,8 @@ class ImageSection(Generic[_T]):
     that lets them hold either just bounding boxes or complete images.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def bbox(self) -> Box2I:
@@ -61,6 +96,82 @@ class ImageSection(Generic[_T]):
         """
         raise NotImplementedError()
 
+    @property
+    def coords(self) -> Tuple[int, int, int, int]:
+        """The minimum x, minimum y, maximum x, and maximum y coordinates of
+        `bbox`, as a `tuple` of `int`.
+
+        Implementations that hold their bounding box should override this to
+        cache the result, so repeated coordinate reads are plain Python
+        integer operations.
+        """
+        return _box_coords(self.bbox)
+
+    def _offset_of(self, coords: Tuple[int, int, int, int]) -> Tuple[int, int]:
+        """Return the (y, x) array offset of a box's minimum point relative to
+        this section's.
+
+        Parameters
+        ----------
+        coords : `tuple` [ `int` ]
+            Minimum x, minimum y, maximum x, and maximum y of the box, as
+            returned by `ImageSection.coords`.
+
+        Returns
+        -------
+        dy : `int`
+            Row offset of the box within this section.
+        dx : `int`
+            Column offset of the box within this section.
+
+        Raises
+        ------
+        ValueError
+            Raised if the box is not contained by this section's bounding box.
+            Array slicing would otherwise wrap negative offsets around or
+            truncate the far edge.
+        """
+        min_x, min_y, max_x, max_y = self.coords
+        box_min_x, box_min_y, box_max_x, box_max_y = coords
+        if box_min_x < min_x or box_min_y < min_y or box_max_x > max_x or box_max_y > max_y:
+            raise ValueError(
+                f"Box with corners ({box_min_x}, {box_min_y}) and ({box_max_x}, {box_max_y}) "
+                f"is not contained by {self.bbox}."
+            )
+        return box_min_y - min_y, box_min_x - min_x
+
+    @property
+    def min_x(self) -> int:
+        """The minimum x coordinate of `bbox` (`int`)."""
+        return self.coords[0]
+
+    @property
+    def min_y(self) -> int:
+        """The minimum y coordinate of `bbox` (`int`)."""
+        return self.coords[1]
+
+    @property
+    def max_x(self) -> int:
+        """The maximum x coordinate of `bbox` (`int`)."""
+        return self.coords[2]
+
+    @property
+    def max_y(self) -> int:
+        """The maximum y coordinate of `bbox` (`int`)."""
+        return self.coords[3]
+
+    @property
+    def width(self) -> int:
+        """The width of `bbox` (`int`)."""
+        coords = self.coords
+        return coords[2] - coords[0] + 1
+
+    @property
+    def height(self) -> int:
+        """The height of `bbox` (`int`)."""
+        coords = self.coords
+        return coords[3] - coords[1] + 1
+
     @property
     @abstractmethod
     def image(self) -> _T:
@@ -124,21 +235,10 @@ class ImageSection(Generic[_T]):
         """
         if image is None:
             return self.without_image()  # type: ignore
-        elif image.__module__.startswith("lsst.afw.image"):
-            from ._afw import AfwImageLike, AfwImageSection
-
-            img = cast(AfwImageLike, image)
-            if self.bbox != img.getBBox():
-                raise ValueError(f"New image has bbox {img.getBBox()}, not {self.bbox}.")
-            return AfwImageSection(img)  # type: ignore
-        elif isinstance(image, np.ndarray):
-            from ._numpy import NumPyImageSection
-
-            if self.bbox.getHeight() != image.shape[0] or self.bbox.getWidth() != image.shape[1]:
-                raise ValueError(f"Array with shape {image.shape} is inconsistent with box {self.bbox}.")
-            return NumPyImageSection(image, self.bbox.getMin())  # type: ignore
-        else:
-            raise TypeError(f"Image {image} of type {type(image)} not recognized.")
+        wrapper = _IMAGE_WRAPPERS.get(type(image))
+        if wrapper is None:
+            wrapper = _register_image_wrapper(image)
+        return wrapper(self, image)
 
     @abstractmethod
     def make_empty(self, bbox: Box2I) -> ImageSection[_T]:
@@ -158,6 +258,28 @@ class ImageSection(Generic[_T]):
         """
         raise NotImplementedError()
 
+    def make_uninitialized(self, bbox: Box2I) -> ImageSection[_T]:
+        """Create an image section of the same image type as ``self`` for the
+        given bounding box, without necessarily initializing its pixels.
+
+        Parameters
+        ----------
+        bbox : `Box2I`
+            Bounding box for the new image.
+
+        Returns
+        -------
+        uninitialized : `ImageSection`
+            An image section object with the same pixel type as ``self`` and
+            the given ``bbox``.  Pixel values are unspecified, so this should
+            only be used when every pixel will be assigned.
+
+        Notes
+        -----
+        The default implementation just calls `make_empty`.
+        """
+        return self.make_empty(bbox)
+
     @abstractmethod
     def subimage(self, bbox: Box2I) -> ImageSection[_T]:
         """Return a `ImageSection` that is a subimage view into ``self``.
@@ -187,6 +309,48 @@ class ImageSection(Generic[_T]):
         """
         raise NotImplementedError()
 
+    def assign_transformed(self, other: ImageSection[_T], transform: ImageSectionTransform) -> None:
+        """Copy values from another image section to ``self``, after applying
+        a transform to them.
+
+        Parameters
+        ----------
+        other : `ImageSection`
+            Image section to copy values from.  Must satisfy
+            ``transform.input_bbox == other.bbox``.
+        transform : `ImageSectionTransform`
+            Transform to apply to ``other``.  Must satisfy
+            ``self.bbox.contains(transform.output_bbox)``.
+
+        Notes
+        -----
+        This is equivalent to
+        ``self.assign(other.apply_transform(transform, allow_view=True))``, but
+        implementations may override it to avoid creating the intermediate
+        transformed image.
+        """
+        self.assign(other.apply_transform(transform, allow_view=True))
+
+    def assign_many(self, others: Iterable[Tuple[ImageSection[_T], ImageSectionTransform]]) -> None:
+        """Copy values from several other image sections to ``self``, after
+        applying a transform to each.
+
+        Parameters
+        ----------
+        others : `Iterable` [ `tuple` [ `ImageSection`, \
+                `ImageSectionTransform` ] ]
+            Pairs of image section and the transform to apply to it, with the
+            same requirements as the arguments to `assign_transformed`.
+
+        Notes
+        -----
+        This is equivalent to calling `assign_transformed` on each pair, but
+        implementations may override it to hoist per-call work out of the
+        loop, e.g. when assembling many amplifiers into a detector image.
+        """
+        for other, transform in others:
+            self.assign_transformed(other, transform)
+
     @abstractmethod
     def apply_transform(self, transform: ImageSectionTransform, *, allow_view: bool) -> ImageSection[_T]:
         """Apply an `ImageSectionTransform` to ``self``.
@@ -208,7 +372,55 @@ class ImageSection(Generic[_T]):
         raise NotImplementedError()
 
 
-@dataclasses.dataclass
+_ImageWrapper = Callable[[ImageSection, Any], ImageSection]
+
+_IMAGE_WRAPPERS: Dict[type, _ImageWrapper] = {}
+"""Functions that adapt an image of a particular type to an `ImageSection`
+with the bounding box of an existing one, keyed by image type.
+
+This is populated by `_register_image_wrapper` the first time each type is
+seen, so backends are only imported when they are actually used.
+"""
+
+
+def _wrap_ndarray(section: ImageSection, image: np.ndarray) -> ImageSection:
+    from ._numpy import NumPyImageSection
+
+    if section.height != image.shape[0] or section.width != image.shape[1]:
+        raise ValueError(f"Array with shape {image.shape} is inconsistent with box {section.bbox}.")
+    return NumPyImageSection._with_bbox(image, section.bbox)
+
+
+def _wrap_afw(section_cls: Any, section: ImageSection, image: Any) -> ImageSection:
+    if section.bbox != image.getBBox():
+        raise ValueError(f"New image has bbox {image.getBBox()}, not {section.bbox}.")
+    return section_cls._with_bbox(image, section.bbox)
+
+
+def _register_image_wrapper(image: Any) -> _ImageWrapper:
+    """Find the `_IMAGE_WRAPPERS` entry for the type of the given image,
+    adding it.
+
+    Raises
+    ------
+    TypeError
+        Raised if the type of ``image`` is not recognized.
+    """
+    image_type = type(image)
+    wrapper: _ImageWrapper
+    if image_type.__module__.startswith("lsst.afw.image"):
+        from ._afw import AfwImageSection
+
+        wrapper = functools.partial(_wrap_afw, AfwImageSection._subclass_for(image))
+    elif isinstance(image, np.ndarray):
+        wrapper = _wrap_ndarray
+    else:
+        raise TypeError(f"Image {image} of type {image_type} not recognized.")
+    _IMAGE_WRAPPERS[image_type] = wrapper
+    return wrapper
+
+
+@dataclasses.dataclass(init=False, frozen=True)
 class ImageSectionTransform:
     """An object that describes how to map a particular `ImageSection` to a
     different coordinate systems.
@@ -230,11 +442,40 @@ class ImageSectionTransform:
     coordinate systems that could (e.g.) be applied to other geometries.
     """
 
-    def __post_init__(self) -> None:
-        if self.input_bbox.getSize() != self.output_bbox.getSize():
-            raise ValueError(
-                f"Input ({self.input_bbox}) and output ({self.output_bbox}) box sizes are inconsistent."
-            )
+    # Declared by hand rather than with dataclass(slots=True), which requires
+    # Python 3.10; that is also why the field defaults live in __init__.
+    __slots__ = (
+        "input_bbox",
+        "output_bbox",
+        "flip_x",
+        "flip_y",
+        "_input_coords",
+        "_output_coords",
+        "_is_identity",
+    )
+
+    def __init__(self, input_bbox: Box2I, output_bbox: Box2I, flip_x: bool = False, flip_y: bool = False):
+        # Integer (min x, min y, max x, max y) for both boxes, so the size
+        # check and derived transforms don't need Point/Extent arithmetic.
+        input_coords = _box_coords(input_bbox)
+        output_coords = _box_coords(output_bbox)
+        in_min_x, in_min_y, in_max_x, in_max_y = input_coords
+        out_min_x, out_min_y, out_max_x, out_max_y = output_coords
+        if in_max_x - in_min_x != out_max_x - out_min_x or in_max_y - in_min_y != out_max_y - out_min_y:
+            raise ValueError(f"Input ({input_bbox}) and output ({output_bbox}) box sizes are inconsistent.")
+        # The dataclass is frozen, so attributes have to be set via object.
+        object.__setattr__(self, "input_bbox", input_bbox)
+        object.__setattr__(self, "output_bbox", output_bbox)
+        object.__setattr__(self, "flip_x", flip_x)
+        object.__setattr__(self, "flip_y", flip_y)
+        object.__setattr__(self, "_input_coords", input_coords)
+        object.__setattr__(self, "_output_coords", output_coords)
+        object.__setattr__(self, "_is_identity", not (flip_x or flip_y) and input_coords == output_coords)
+
+    def __reduce__(self) -> tuple:
+        # The default reduction for slotted classes restores state with
+        # setattr, which a frozen dataclass rejects.
+        return (type(self), (self.input_bbox, self.output_bbox, self.flip_x, self.flip_y))
 
     input_bbox: Box2I
     """The bounding box that the image section is expected to start with
@@ -246,11 +487,11 @@ class ImageSectionTransform:
     applied (`Box2I`).
     """
 
-    flip_x: bool = False
+    flip_x: bool
     """Whether the x axis must be inverted to apply this transform (`bool`).
     """
 
-    flip_y: bool = False
+    flip_y: bool
     """Whether the y axis must be inverted to apply this transform (`bool`).
     """
 
@@ -265,7 +506,7 @@ class ImageSectionTransform:
     def is_identity(self) -> bool:
         """`True` if this transform does nothing; `False` otherwise
         (`bool`)."""
-        return not (self.flip_x or self.flip_y) and self.input_bbox == self.output_bbox
+        return self._is_identity
 
     def after(self, other: ImageSectionTransform) -> ImageSectionTransform:
         """Return the transform with the same output target as ``self``,
@@ -288,6 +529,22 @@ class ImageSectionTransform:
             flip_y=(self.flip_y != other.flip_y),
         )
 
+    def inverse(self) -> ImageSectionTransform:
+        """Return the transform that undoes this one.
+
+        Returns
+        -------
+        inverse : `ImageSectionTransform`
+            Transform that maps ``self.output_bbox`` back to
+            ``self.input_bbox``, with the same flips.
+        """
+        return ImageSectionTransform(
+            self.output_bbox,
+            self.input_bbox,
+            flip_x=self.flip_x,
+            flip_y=self.flip_y,
+        )
+
     def for_subimage(self, bbox: Box2I) -> ImageSectionTransform:
         """Return the transform that maps a subimage to the same coordinate
         system.
@@ -305,21 +562,40 @@ class ImageSectionTransform:
             to the appropriate location within ``self.output_bbox`` and applies
             the same flips.
         """
-        # Distances (defined to be positive) between minimum points of both
-        # boxes and maximum points of both boxes.
-        lower_dist_x, lower_dist_y = bbox.getMin() - self.input_bbox.getMin()
-        upper_dist_x, upper_dist_y = self.input_bbox.getMax() - bbox.getMax()
-        if self.flip_x:
-            lower_dist_x, upper_dist_x = upper_dist_x, lower_dist_x
-        if self.flip_y:
-            lower_dist_y, upper_dist_y = upper_dist_y, lower_dist_y
-        output_bbox = Box2I(
-            minimum=self.output_bbox.getMin() + ExtentI(lower_dist_x, lower_dist_y),
-            maximum=self.output_bbox.getMax() - ExtentI(upper_dist_x, upper_dist_y),
-        )
+        (output_bbox,) = self._map_subimage_bboxes((bbox,))
         return ImageSectionTransform(
             input_bbox=bbox,
             output_bbox=output_bbox,
             flip_x=self.flip_x,
             flip_y=self.flip_y,
         )
+
+    def _map_subimage_bboxes(self, bboxes: Iterable[Box2I]) -> List[Box2I]:
+        """Return the ``output_bbox`` that `for_subimage` would compute for
+        each of several subimage bounding boxes, without constructing the
+        transforms themselves.
+        """
+        in_min_x, in_min_y, in_max_x, in_max_y = self._input_coords
+        out_min_x, out_min_y, _, _ = self._output_coords
+        # Each axis is either a shift by some offset or a reflection about
+        # some point; both are computed once here for all boxes.  Because the
+        # input and output boxes have the same size, x -> c - x maps the input
+        # minimum to the output maximum and vice versa.
+        if self.flip_x:
+            sign_x, offset_x = -1, out_min_x + in_max_x
+        else:
+            sign_x, offset_x = 1, out_min_x - in_min_x
+        if self.flip_y:
+            sign_y, offset_y = -1, out_min_y + in_max_y
+        else:
+            sign_y, offset_y = 1, out_min_y - in_min_y
+        result = []
+        for bbox in bboxes:
+            x0 = offset_x + sign_x * bbox.getMinX()
+            x1 = offset_x + sign_x * bbox.getMaxX()
+            y0 = offset_y + sign_y * bbox.getMinY()
+            y1 = offset_y + sign_y * bbox.getMaxY()
+            result.append(
+                Box2I(minimum=PointI(min(x0, x1), min(y0, y1)), maximum=PointI(max(x0, x1), max(y0, y1)))
+            )
+        return result
@@ -0,0 +1,111 @@
+# This file is part of amplifier_images.
+#
+# Developed for the LSST Data Management System.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Low-level pixel-copy helpers shared by the `ImageSection` implementations
+that can expose their pixels as `numpy.ndarray` objects.
+"""
+
+from __future__ import annotations
+
+__all__ = ("copy_flipped", "flip_copy", "storage_order")
+
+import numpy as np
+
+
+def copy_flipped(dst: np.ndarray, dy0: int, dx0: int, src: np.ndarray, flip_y: bool, flip_x: bool) -> None:
+    """Copy an array into a block of another array, flipping it on the way.
+
+    Parameters
+    ----------
+    dst : `numpy.ndarray`
+        Array to copy into.  The first two dimensions are (y, x).
+    dy0 : `int`
+        Row index in ``dst`` of the first row of the block to write.
+    dx0 : `int`
+        Column index in ``dst`` of the first column of the block to write.
+    src : `numpy.ndarray`
+        Array to copy from.  Must have the same number of dimensions as
+        ``dst``, and any dimensions beyond the first two must be the same.
+    flip_y : `bool`
+        Whether to reverse the order of rows in ``src`` while copying.
+    flip_x : `bool`
+        Whether to reverse the order of columns in ``src`` while copying.
+
+    Notes
+    -----
+    The flip is expressed as a negative-stride view of ``src`` that is written
+    straight into the destination block, so no intermediate flipped buffer is
+    ever allocated.
+    """
+    height, width = src.shape[:2]
+    np.copyto(
+        dst[dy0 : dy0 + height, dx0 : dx0 + width, ...],  # noqa: E203
+        src[:: -1 if flip_y else 1, :: -1 if flip_x else 1, ...],
+    )
+
+
+def flip_copy(src: np.ndarray, flip_y: bool, flip_x: bool) -> np.ndarray:
+    """Return a flipped copy of an array, in the same storage order.
+
+    Parameters
+    ----------
+    src : `numpy.ndarray`
+        Array to copy.  The first two dimensions are (y, x).
+    flip_y : `bool`
+        Whether to reverse the order of rows.
+    flip_x : `bool`
+        Whether to reverse the order of columns.
+
+    Returns
+    -------
+    flipped : `numpy.ndarray`
+        New contiguous array with the same shape and dtype as ``src``, in the
+        same storage order (see `storage_order`).
+
+    Notes
+    -----
+    The output is allocated uninitialized and filled in a single pass by
+    `copy_flipped`.  The destination is always contiguous, so NumPy copies
+    whole rows (or columns, for column-major arrays) at a time when only the
+    slow axis is flipped; that is faster than copying row by row from Python.
+    """
+    dst = np.empty(src.shape, dtype=src.dtype, order=storage_order(src))
+    copy_flipped(dst, 0, 0, src, flip_y, flip_x)
+    return dst
+
+
+def storage_order(array: np.ndarray) -> str:
+    """Return the storage order new arrays derived from ``array`` should use.
+
+    Parameters
+    ----------
+    array : `numpy.ndarray`
+        Array to inspect.
+
+    Returns
+    -------
+    order : `str`
+        ``"F"`` if ``array`` is column-major (and not also row-major, as
+        1-d-like arrays are); ``"C"`` otherwise, including for non-contiguous
+        views.
+    """
+    flags = array.flags
+    return "F" if flags.f_contiguous and not flags.c_contiguous else "C"
@@ -23,6 +23,8 @@ from __future__ import annotations
 
 __all__ = ("NumPyImageSection",)
 
+from typing import Iterable, Literal, Optional, Tuple
+
 import numpy as np
 
 from lsst.geom import Box2I, ExtentI, PointI
@@ -31,6 +33,7 @@ from ._image_section import (
     ImageSection,
     ImageSectionTransform,
 )
+from ._kernels import copy_flipped, flip_copy, storage_order
 
 
 class NumPyImageSection(ImageSection[np.ndarray]):
@@ -41,20 +44,73 @@ class NumPyImageSection(ImageSection[np.ndarray]):
     ----------
     array : `numpy.ndarray`
         Array to adapt.  ``array.shape[0]`` is used as the bounding box
-        height and ``array.shape[1]`` is used as the bounding box height; any
+        height and ``array.shape[1]`` is used as the bounding box width; any
         number of additional dimensions may be present.
-    min : `PointI`
+    bbox_min : `PointI`
         Minimum point of the image's bounding box.
+    order : `str`, optional
+        If ``"C"`` (row-major) or ``"F"`` (column-major), copy ``array`` into
+        that storage order if it is not already in it.  If `None` (default),
+        ``array`` is used as given.
+
+    Notes
+    -----
+    Arrays created by this class (by `copy`, `make_empty`, and
+    `apply_transform` with flips) have the same storage order as the array
+    they are derived from, so a column-major section stays column-major.
+    Column-major storage makes flips in x copy whole columns, which can be
+    preferable for amplifiers whose serial readout direction is along y.
     """
 
-    def __init__(self, array: np.ndarray, bbox_min: PointI):
+    __slots__ = ("_array", "_bbox_min", "_bbox", "_coords")
+
+    def __init__(self, array: np.ndarray, bbox_min: PointI, *, order: Optional[Literal["C", "F"]] = None):
+        if order == "C":
+            array = np.ascontiguousarray(array)
+        elif order == "F":
+            array = np.asfortranarray(array)
+        elif order is not None:
+            raise ValueError(f"Invalid storage order {order!r}; expected 'C', 'F', or None.")
         self._array = array
         self._bbox_min = bbox_min
+        self._bbox = Box2I(bbox_min, ExtentI(array.shape[1], array.shape[0]))
+        self._coords: Optional[Tuple[int, int, int, int]] = None
+
+    @classmethod
+    def _with_bbox(cls, array: np.ndarray, bbox: Box2I) -> NumPyImageSection:
+        """Construct from an array whose bounding box is already known.
+
+        Parameters
+        ----------
+        array : `numpy.ndarray`
+            Array to adapt.
+        bbox : `Box2I`
+            Bounding box of ``array``; its size must match the first two
+            dimensions of ``array.shape``.
+
+        Returns
+        -------
+        section : `NumPyImageSection`
+            New image section.
+        """
+        self = cls.__new__(cls)
+        self._array = array
+        self._bbox_min = bbox.getMin()
+        self._bbox = bbox
+        self._coords = None
+        return self
 
     @property
     def bbox(self) -> Box2I:
         # Docstring inherited.
-        return Box2I(self._bbox_min, ExtentI(self._array.shape[1], self._array.shape[0]))
+        return self._bbox
+
+    @property
+    def coords(self) -> Tuple[int, int, int, int]:
+        # Docstring inherited.
+        if self._coords is None:
+            self._coords = super().coords
+        return self._coords
 
     @property
     def image(self) -> np.ndarray:
@@ -63,28 +119,96 @@ class NumPyImageSection(ImageSection[np.ndarray]):
 
     def copy(self) -> NumPyImageSection:
         # Docstring inherited.
-        return NumPyImageSection(self._array.copy(), self._bbox_min)
+        array = np.empty(self._array.shape, dtype=self._array.dtype, order=storage_order(self._array))
+        np.copyto(array, self._array)
+        return self._with_bbox(array, self._bbox)
 
     def make_empty(self, bbox: Box2I) -> NumPyImageSection:
         # Docstring inherited.
-        return NumPyImageSection(np.zeros_like(self._array), self._bbox_min)
+        # Zero-initialized, for consistency with lsst.afw.image constructors.
+        shape = (bbox.getHeight(), bbox.getWidth()) + self._array.shape[2:]
+        array = np.zeros(shape, dtype=self._array.dtype, order=storage_order(self._array))
+        return self._with_bbox(array, bbox)
+
+    def make_uninitialized(self, bbox: Box2I) -> NumPyImageSection:
+        # Docstring inherited.
+        shape = (bbox.getHeight(), bbox.getWidth()) + self._array.shape[2:]
+        array = np.empty(shape, dtype=self._array.dtype, order=storage_order(self._array))
+        return self._with_bbox(array, bbox)
 
     def subimage(self, bbox: Box2I) -> NumPyImageSection:
         # Docstring inherited.
-        start = bbox.getMin() - self._bbox_min
-        stop = start + bbox.getSize()
-        return NumPyImageSection(
-            self._array[start.getY() : stop.getY(), start.getX() : stop.getX(), ...],  # noqa:E203
-            bbox,
-        )
+        if bbox == self._bbox:
+            return self
+        min_x, min_y, _, _ = self.coords
+        x0 = bbox.getMinX() - min_x
+        y0 = bbox.getMinY() - min_y
+        x1 = bbox.getMaxX() - min_x + 1
+        y1 = bbox.getMaxY() - min_y + 1
+        return self._with_bbox(self._array[y0:y1, x0:x1, ...], bbox)
 
     def assign(self, other: ImageSection[np.ndarray]) -> None:
         # Docstring inherited.
-        self.subimage(other.bbox).image[...] = other.image
+        # Slice directly instead of going through subimage, which would build
+        # a temporary section and do Box2I arithmetic.
+        src = other.image
+        dy, dx = self._offset_of(other.coords)
+        np.copyto(self._array[dy : dy + src.shape[0], dx : dx + src.shape[1], ...], src)  # noqa: E203
+
+    def assign_transformed(self, other: ImageSection[np.ndarray], transform: ImageSectionTransform) -> None:
+        # Docstring inherited.
+        dy, dx = self._offset_of(transform._output_coords)
+        copy_flipped(self._array, dy, dx, other.image, transform.flip_y, transform.flip_x)
+
+    def assign_many(
+        self, others: Iterable[Tuple[ImageSection[np.ndarray], ImageSectionTransform]]
+    ) -> None:
+        # Docstring inherited.
+        dst = self._array
+        for other, transform in others:
+            dy, dx = self._offset_of(transform._output_coords)
+            copy_flipped(dst, dy, dx, other.image, transform.flip_y, transform.flip_x)
 
     def apply_transform(self, transform: ImageSectionTransform, *, allow_view: bool) -> NumPyImageSection:
         # Docstring inherited.
-        array = self._array[:: -1 if transform.flip_y else 1, :: -1 if transform.flip_x else 1]
+        if transform.is_identity:
+            return self if allow_view else self.copy()
         if not allow_view:
-            array = array.copy()
-        return NumPyImageSection(array, transform.output_bbox.getMin())
+            array = flip_copy(self._array, transform.flip_y, transform.flip_x)
+        elif transform.flip_x or transform.flip_y:
+            array = self._array[:: -1 if transform.flip_y else 1, :: -1 if transform.flip_x else 1]
+        else:
+            # A pure shift only changes the bounding box; rebind the same
+            # array rather than making a trivial view of it.
+            array = self._array
+        return self._with_bbox(array, transform.output_bbox)
+
+    def apply_transform_into(self, transform: ImageSectionTransform, out: np.ndarray) -> NumPyImageSection:
+        """Apply an `ImageSectionTransform` to ``self``, writing the result to
+        an existing array.
+
+        Parameters
+        ----------
+        transform : `ImageSectionTransform`
+            Transform to apply.  Must satisfy
+            ``transform.input_bbox == self.bbox``.
+        out : `numpy.ndarray`
+            Array to write the transformed pixels to, e.g. a scratch buffer
+            reused across many amplifiers.  Must have the same shape as
+            ``self.image`` and should not share memory with it.
+
+        Returns
+        -------
+        transformed : `NumPyImageSection`
+            Image section that adapts ``out``, with
+            ``transformed.bbox == transform.output_bbox``.
+
+        Raises
+        ------
+        ValueError
+            Raised if ``out`` has the wrong shape.
+        """
+        if out.shape != self._array.shape:
+            raise ValueError(f"Output array has shape {out.shape}, not {self._array.shape}.")
+        copy_flipped(out, 0, 0, self._array, transform.flip_y, transform.flip_x)
+        return self._with_bbox(out, transform.output_bbox)
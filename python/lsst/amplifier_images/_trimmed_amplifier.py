@@ -58,6 +58,24 @@ class TrimmedAmplifier(Amplifier[_T]):
         coordinates.
     """
 
+    __slots__ = (
+        "amplifier_id",
+        "data",
+        "readout_transform",
+        "horizontal_overscan_boundary",
+        "vertical_overscan_boundary",
+        "horizontal_prescan_boundary",
+        "physical_transform",
+        "_horizontal_overscan_is_at_min",
+        "_vertical_overscan_is_at_min",
+        "_horizontal_prescan_is_at_min",
+    )
+
+    physical_transform: ImageSectionTransform
+    """Tranform that maps this amplifier into its location in assembled and
+    trimmed detector coordinates (`ImageSectionTransform`).
+    """
+
     def __init__(
         self,
         data: ImageSection[_T],
@@ -71,91 +89,52 @@ class TrimmedAmplifier(Amplifier[_T]):
     ):
         assert readout_transform.input_bbox == data.bbox
         assert physical_transform.input_bbox == data.bbox
-        self._data = data
-        self._amplifier_id = amplifier_id
-        self._readout_transform = readout_transform
+        min_x, min_y, max_x, max_y = data.coords
+        self.data = data
+        self.amplifier_id = amplifier_id
+        self.readout_transform = readout_transform
+        self.physical_transform = physical_transform
+        self.horizontal_overscan_boundary = min_x if horizontal_overscan_is_at_min else max_x
+        self.vertical_overscan_boundary = min_y if vertical_overscan_is_at_min else max_y
+        self.horizontal_prescan_boundary = min_x if horizontal_prescan_is_at_min else max_x
         self._horizontal_overscan_is_at_min = horizontal_overscan_is_at_min
         self._vertical_overscan_is_at_min = vertical_overscan_is_at_min
         self._horizontal_prescan_is_at_min = horizontal_prescan_is_at_min
-        self._physical_transform = physical_transform
 
     def copy(self) -> TrimmedAmplifier[_T]:
         # Docstring inherited.
         return TrimmedAmplifier(
-            self._data.copy(),
+            self.data.copy(),
             amplifier_id=self.amplifier_id,
-            readout_transform=self._readout_transform,
+            readout_transform=self.readout_transform,
             horizontal_overscan_is_at_min=self._horizontal_overscan_is_at_min,
             vertical_overscan_is_at_min=self._vertical_overscan_is_at_min,
             horizontal_prescan_is_at_min=self._horizontal_prescan_is_at_min,
-            physical_transform=self._physical_transform,
+            physical_transform=self.physical_transform,
         )
 
     def without_images(self) -> TrimmedAmplifier[None]:
         # Docstring inherited.
-        if self._data.image is None:
+        if self.data.image is None:
             return self  # type: ignore
         return TrimmedAmplifier(
-            self._data.without_image(),
+            self.data.without_image(),
             amplifier_id=self.amplifier_id,
-            readout_transform=self._readout_transform,
+            readout_transform=self.readout_transform,
             horizontal_overscan_is_at_min=self._horizontal_overscan_is_at_min,
             vertical_overscan_is_at_min=self._vertical_overscan_is_at_min,
             horizontal_prescan_is_at_min=self._horizontal_prescan_is_at_min,
-            physical_transform=self._physical_transform,
+            physical_transform=self.physical_transform,
         )
 
-    @property
-    def amplifier_id(self) -> int:
-        # Docstring inherited.
-        return self._amplifier_id
-
-    @property
-    def data(self) -> ImageSection[_T]:
-        # Docstring inherited.
-        return self._data
-
     @property
     def trimmed_view(self) -> TrimmedAmplifier[_T]:
         # Docstring inherited.
         return self
 
-    @property
-    def readout_transform(self) -> ImageSectionTransform:
-        # Docstring inherited.
-        return self._readout_transform
-
     def into_readout_coordinates(self, *, allow_view: bool = False) -> TrimmedAmplifier[_T]:
         # Docstring inherited.
-        new_data = self._data.apply_transform(self._readout_transform, allow_view=allow_view)
-        return TrimmedAmplifier[_T](
-            new_data,
-            amplifier_id=self.amplifier_id,
-            readout_transform=ImageSectionTransform(new_data.bbox),
-            horizontal_overscan_is_at_min=(
-                self._horizontal_overscan_is_at_min != self._readout_transform.flip_x
-            ),
-            vertical_overscan_is_at_min=(self._vertical_overscan_is_at_min != self._readout_transform.flip_y),
-            horizontal_prescan_is_at_min=(
-                self._horizontal_prescan_is_at_min != self._readout_transform.flip_x
-            ),
-            physical_transform=self._physical_transform.after(self._readout_transform),
-        )
-
-    @property
-    def horizontal_overscan_boundary(self) -> int:
-        # Docstring inherited.
-        return self._data.bbox.getMinX() if self._horizontal_overscan_is_at_min else self._data.bbox.getMaxX()
-
-    @property
-    def vertical_overscan_boundary(self) -> int:
-        # Docstring inherited.
-        return self._data.bbox.getMinY() if self._vertical_overscan_is_at_min else self._data.bbox.getMaxY()
-
-    @property
-    def horizontal_prescan_boundary(self) -> int:
-        # Docstring inherited.
-        return self._data.bbox.getMinX() if self._horizontal_prescan_is_at_min else self._data.bbox.getMaxX()
+        return self.apply_transform(self.readout_transform, allow_view=allow_view)
 
     def with_new_data_image(self, image: _U) -> TrimmedAmplifier[_U]:
         """Return a version of this amplifier with the given data section image
@@ -182,24 +161,17 @@ class TrimmedAmplifier(Amplifier[_T]):
             Raised if the given image's bounding box is not consistent with
             ``self.detector.bbox``.
         """
-        new_data = self._data.with_new_image(image)
+        new_data = self.data.with_new_image(image)
         return TrimmedAmplifier(
             new_data,
             amplifier_id=self.amplifier_id,
-            readout_transform=self._readout_transform,
+            readout_transform=self.readout_transform,
             horizontal_overscan_is_at_min=self._horizontal_overscan_is_at_min,
             vertical_overscan_is_at_min=self._vertical_overscan_is_at_min,
             horizontal_prescan_is_at_min=self._horizontal_prescan_is_at_min,
-            physical_transform=self._physical_transform,
+            physical_transform=self.physical_transform,
         )
 
-    @property
-    def physical_transform(self) -> ImageSectionTransform:
-        """Tranform that maps this amplifier into its location in assembled
-        and trimmed detector coordinates (`ImageSectionTransform`).
-        """
-        return self._physical_transform
-
     def into_physical_coordinates(self, *, allow_view: bool = False) -> TrimmedAmplifier[_T]:
         """Return a new `Amplifier` with the same trim state that is guaranteed
         to satisfy ``self.physical_transform.is_identity``.
@@ -218,19 +190,78 @@ class TrimmedAmplifier(Amplifier[_T]):
         amplifier : `TrimmedAmplifer`
             Amplifier in physical coordinates.
         """
-        new_data = self._data.apply_transform(self._physical_transform, allow_view=allow_view)
+        return self.apply_transform(self.physical_transform, allow_view=allow_view)
+
+    def apply_transform(
+        self, transform: ImageSectionTransform, *, allow_view: bool = False
+    ) -> TrimmedAmplifier[_T]:
+        """Return a new `Amplifier` with the same trim state whose data
+        section has been transformed.
+
+        Parameters
+        ----------
+        transform : `ImageSectionTransform`
+            Transform to apply.  Must satisfy
+            ``transform.input_bbox == self.data.bbox``.
+        allow_view : `bool`,
+            If `True` (`False` is default), permit the result to share pixels
+            with ``self``; in this case it may even be ``self``.
+
+        Returns
+        -------
+        amplifier : `TrimmedAmplifer`
+            Amplifier whose data section has ``transform.output_bbox`` as its
+            bounding box, with `readout_transform` and `physical_transform`
+            updated to still map to the same coordinate systems.
+
+        Notes
+        -----
+        `into_readout_coordinates` and `into_physical_coordinates` are
+        equivalent to calling this with `readout_transform` and
+        `physical_transform`, respectively.  Calling it with some other
+        transform (e.g. a composition of several coordinate changes) moves the
+        pixels only once, instead of once per coordinate change.
+        """
+        if transform.is_identity:
+            return self if allow_view else self.copy()
+        return self._rebased(self.data.apply_transform(transform, allow_view=allow_view), transform)
+
+    def _as_detector_view(self, detector: ImageSection[_U]) -> TrimmedAmplifier[_U]:
+        """Return a version of this amplifier in physical coordinates whose
+        data section is a subimage of the given detector image.
+
+        Parameters
+        ----------
+        detector : `ImageSection`
+            Full-detector image section in physical coordinates; must contain
+            ``self.physical_transform.output_bbox``.
+
+        Returns
+        -------
+        amplifier : `TrimmedAmplifier`
+            Amplifier whose data section is a view into ``detector``.  Any
+            image in ``self.data`` is ignored.
+        """
+        return self._rebased(detector.subimage(self.physical_transform.output_bbox), self.physical_transform)
+
+    def _rebased(self, new_data: ImageSection[_U], transform: ImageSectionTransform) -> TrimmedAmplifier[_U]:
+        """Return an amplifier with the given data section, which must be the
+        result of applying the given transform to ``self.data``, with all
+        other state updated to match.
+        """
+        if transform.is_identity:
+            readout_transform = self.readout_transform
+            physical_transform = self.physical_transform
+        else:
+            inverse = transform.inverse()
+            readout_transform = self.readout_transform.after(inverse)
+            physical_transform = self.physical_transform.after(inverse)
         return TrimmedAmplifier(
             new_data,
             amplifier_id=self.amplifier_id,
-            readout_transform=self._readout_transform.after(self._physical_transform),
-            horizontal_overscan_is_at_min=(
-                self._horizontal_overscan_is_at_min != self._physical_transform.flip_x
-            ),
-            vertical_overscan_is_at_min=(
-                self._vertical_overscan_is_at_min != self._physical_transform.flip_y
-            ),
-            horizontal_prescan_is_at_min=(
-                self._horizontal_prescan_is_at_min != self._physical_transform.flip_x
-            ),
-            physical_transform=ImageSectionTransform.make_identity(new_data.bbox),
+            readout_transform=readout_transform,
+            horizontal_overscan_is_at_min=(self._horizontal_overscan_is_at_min != transform.flip_x),
+            vertical_overscan_is_at_min=(self._vertical_overscan_is_at_min != transform.flip_y),
+            horizontal_prescan_is_at_min=(self._horizontal_prescan_is_at_min != transform.flip_x),
+            physical_transform=physical_transform,
         )
@@ -28,13 +28,17 @@ __all__ = (
 )
 
 from abc import abstractmethod
-from typing import Any, Iterable, Iterator, List, TypeVar
+from typing import Any, Iterable, Iterator, Optional, Sequence, Tuple, TypeVar
 
-from lsst.geom import Box2I
-
-from ._image_section import ImageSection
+from ._image_section import ImageSection, _tiling_of_outputs
 from ._trimmed_amplifier import TrimmedAmplifier
-from ._amplifier_set import AmplifierSet, IncompleteAmplifierSetError
+from ._amplifier_set import (
+    AmplifierSet,
+    AmplifierSetArrays,
+    IncompleteAmplifierSetError,
+    _find_amplifier,
+    _sort_amplifiers,
+)
 
 _T = TypeVar("_T")
 _U = TypeVar("_U")
@@ -51,35 +55,40 @@ class TrimmedAmplifierSet(AmplifierSet[_T]):
     amplifiers : `Iterable` [ `TrimmedAmplifier` ]
         An iterable of `TrimmedAmplifer` objects to include in the set.
         Iterators and single-pass iterators are permitted.  Must be from the
-        same detector, and have the same image type.
+        same detector, have the same image type, and have unique amplifier
+        IDs.  The set iterates over them in order of amplifier ID.
+    is_complete : `bool`
+        Whether all amplifiers for the detector are included.
     observation_info, optional
         Additional information describing an observation that is the same for
         all amplifiers in the detector.  See also
         `AmplifierSet.observation_info`.
     """
 
+    __slots__ = ("_amplifiers", "_ids", "_id_offset", "observation_info", "is_complete")
+
     def __init__(
         self,
         amplifiers: Iterable[TrimmedAmplifier[_T]],
         *,
+        is_complete: bool,
         observation_info: Any = None,
     ):
-        self._mapping = {amp.amplifier_id: amp for amp in amplifiers}
-        self._observation_info = observation_info
+        # Amplifier IDs are small integers that are usually contiguous, so
+        # sorted tuples are both smaller and faster to index than a dict.
+        self._amplifiers, self._ids, self._id_offset = _sort_amplifiers(amplifiers)
+        self.is_complete = is_complete
+        self.observation_info = observation_info
+        self._arrays = None
 
     def __getitem__(self, amplifier_id: int) -> TrimmedAmplifier[_T]:
-        return self._mapping[amplifier_id]
+        return _find_amplifier(self._amplifiers, self._ids, self._id_offset, amplifier_id)
 
     def __iter__(self) -> Iterator[TrimmedAmplifier[_T]]:
-        return iter(self._mapping.values())
+        return iter(self._amplifiers)
 
     def __len__(self) -> int:
-        return len(self._mapping)
-
-    @property
-    def observation_info(self) -> Any:
-        # Docstring inherited.
-        return self._observation_info
+        return len(self._amplifiers)
 
     @property
     def trimmed_view(self) -> TrimmedAmplifierSet[_T]:
@@ -116,58 +125,133 @@ class UnassembledTrimmedAmplifierSet(TrimmedAmplifierSet[_T]):
         `AmplifierSet.observation_info`.
     """
 
+    __slots__ = ("_in_readout_coordinates",)
+
     def __init__(
         self, amplifiers: Iterable[TrimmedAmplifier[_T]], is_complete: bool, *, observation_info: Any = None
     ):
-        super().__init__(amplifiers, observation_info=observation_info)
-        self._is_complete = is_complete
+        super().__init__(amplifiers, is_complete=is_complete, observation_info=observation_info)
+        # Whether all amplifiers have identity readout transforms; computed on
+        # first use, or passed along by methods that already know it.
+        self._in_readout_coordinates: Optional[bool] = None
 
-    def copy(self) -> TrimmedAmplifierSet[_T]:
-        # Docstring inherited.
-        return UnassembledTrimmedAmplifierSet(
-            (amp.copy() for amp in self),
-            is_complete=self._is_complete,
+    def _is_in_readout_coordinates(self) -> bool:
+        """Return whether all amplifiers are already in readout coordinates.
+        """
+        if self._in_readout_coordinates is None:
+            self._in_readout_coordinates = all(amp.readout_transform.is_identity for amp in self._amplifiers)
+        return self._in_readout_coordinates
+
+    @classmethod
+    def _from_sorted(
+        cls,
+        amplifiers: Tuple[TrimmedAmplifier[_U], ...],
+        ids: Tuple[int, ...],
+        id_offset: Optional[int],
+        *,
+        is_complete: bool,
+        observation_info: Any,
+        in_readout_coordinates: Optional[bool] = None,
+        arrays: Optional[AmplifierSetArrays] = None,
+    ) -> UnassembledTrimmedAmplifierSet[_U]:
+        """Construct from amplifiers that are already sorted, with no
+        checking.
+
+        Parameters
+        ----------
+        amplifiers : `tuple` [ `TrimmedAmplifier` ]
+            Amplifiers sorted by ID, with unique IDs.
+        ids : `tuple` [ `int` ]
+            IDs of ``amplifiers``, as returned by `_sort_amplifiers`.
+        id_offset : `int` or `None`
+            ID lookup offset, as returned by `_sort_amplifiers`.
+        is_complete : `bool`
+            Whether all amplifiers for the detector are included.
+        observation_info
+            Additional information describing an observation that is the same
+            for all amplifiers in the detector.
+        in_readout_coordinates : `bool`, optional
+            Whether all of ``amplifiers`` are in readout coordinates, if known.
+        arrays : `AmplifierSetArrays`, optional
+            Already-computed metadata arrays for ``amplifiers``, if any.
+        """
+        self = cls.__new__(cls)
+        self._amplifiers = amplifiers
+        self._ids = ids
+        self._id_offset = id_offset
+        self.is_complete = is_complete
+        self.observation_info = observation_info
+        self._arrays = arrays
+        self._in_readout_coordinates = in_readout_coordinates
+        return self
+
+    def _derived(
+        self,
+        amplifiers: Tuple[TrimmedAmplifier[_U], ...],
+        *,
+        in_readout_coordinates: Optional[bool] = None,
+        arrays: Optional[AmplifierSetArrays] = None,
+    ) -> UnassembledTrimmedAmplifierSet[_U]:
+        """Return a new set with the same flags and observation information
+        as ``self``, holding the given amplifiers.
+
+        Parameters
+        ----------
+        amplifiers : `tuple` [ `TrimmedAmplifier` ]
+            Amplifiers derived from those in ``self``, in the same order and
+            with the same IDs.  This is not checked.
+        in_readout_coordinates : `bool`, optional
+            Whether all of ``amplifiers`` are in readout coordinates, if known.
+        arrays : `AmplifierSetArrays`, optional
+            Already-computed metadata arrays for ``amplifiers``, if any.
+        """
+        # Skip the constructor: the amplifiers are already in order and their
+        # IDs already known to be unique.
+        return UnassembledTrimmedAmplifierSet._from_sorted(
+            amplifiers,
+            self._ids,
+            self._id_offset,
+            is_complete=self.is_complete,
             observation_info=self.observation_info,
+            in_readout_coordinates=in_readout_coordinates,
+            arrays=arrays,
         )
 
-    def without_images(self) -> TrimmedAmplifierSet[None]:
+    def copy(self) -> TrimmedAmplifierSet[_T]:
         # Docstring inherited.
-        return UnassembledTrimmedAmplifierSet(
-            (amp.without_images() for amp in self),
-            is_complete=self._is_complete,
-            observation_info=self.observation_info,
+        # Copies and image-less versions have the same metadata.
+        return self._derived(
+            tuple([amp.copy() for amp in self._amplifiers]),
+            in_readout_coordinates=self._in_readout_coordinates,
+            arrays=self._arrays,
         )
 
-    @property
-    def is_complete(self) -> bool:
+    def without_images(self) -> TrimmedAmplifierSet[None]:
         # Docstring inherited.
-        return self._is_complete
+        # Amplifiers in a set have the same image type, so this normally
+        # stops at the first one.
+        if all(amp.data.image is None for amp in self._amplifiers):
+            return self  # type: ignore
+        return self._derived(
+            tuple([amp.without_images() for amp in self._amplifiers]),
+            in_readout_coordinates=self._in_readout_coordinates,
+            arrays=self._arrays,
+        )
 
     def into_readout_coordinates(self, *, allow_view: bool = False) -> TrimmedAmplifierSet[_T]:
         # Docstring inherited.
-        if allow_view and all(amp.readout_transform.is_identity for amp in self):
+        if allow_view and self._is_in_readout_coordinates():
             return self
-        return UnassembledTrimmedAmplifierSet(
-            (amp.into_readout_coordinates(allow_view=allow_view) for amp in self),
-            is_complete=self._is_complete,
-            observation_info=self.observation_info,
+        return self._derived(
+            tuple([amp.into_readout_coordinates(allow_view=allow_view) for amp in self._amplifiers]),
+            in_readout_coordinates=True,
         )
 
     def assemble_into_trimmed(self, *, allow_view: bool = False) -> AssembledTrimmedAmplifierSet[_T]:
         # Docstring inherited.
-        if not self.is_complete or not self:
+        if not (self.is_complete and self._amplifiers):
             raise IncompleteAmplifierSetError()
-        detector_bbox = Box2I()
-        for amp in self:
-            detector_bbox.include(amp.physical_transform.output_bbox)
-        # amp is guaranteed to be bound because we tested for 'not self' above.
-        detector = amp.data.make_empty(detector_bbox)  # type: ignore
-        new_amplifiers: List[TrimmedAmplifier[_T]] = []
-        for amp in self:
-            new_amp = amp.into_physical_coordinates(allow_view=True)
-            detector.assign(new_amp.data)
-            new_amplifiers.append(new_amp)
-        return AssembledTrimmedAmplifierSet(detector, new_amplifiers, observation_info=self.observation_info)
+        return _assemble_trimmed(self._amplifiers, self.observation_info)
 
 
 class AssembledTrimmedAmplifierSet(TrimmedAmplifierSet[_T]):
@@ -196,6 +280,11 @@ class AssembledTrimmedAmplifierSet(TrimmedAmplifierSet[_T]):
         `AmplifierSet.observation_info`.
     """
 
+    __slots__ = ("detector",)
+
+    detector: ImageSection[_T]
+    """The full trimmed detector image (`ImageSection`)."""
+
     def __init__(
         self,
         detector: ImageSection[_T],
@@ -203,10 +292,10 @@ class AssembledTrimmedAmplifierSet(TrimmedAmplifierSet[_T]):
         *,
         observation_info: Any = None,
     ):
-        self._detector = detector
-        physical_amplifiers = (amp.into_physical_coordinates(allow_view=True) for amp in amplifiers)
+        self.detector = detector
         super().__init__(
-            (amp.with_new_data_image(detector.subimage(amp.data.bbox).image) for amp in physical_amplifiers),
+            (amp._as_detector_view(detector) for amp in amplifiers),
+            is_complete=True,
             observation_info=observation_info,
         )
 
@@ -216,6 +305,7 @@ class AssembledTrimmedAmplifierSet(TrimmedAmplifierSet[_T]):
         detector: ImageSection[_T],
         amplifiers: Iterable[TrimmedAmplifier[_T]],
         observation_info: Any = None,
+        arrays: Optional[AmplifierSetArrays] = None,
     ) -> AssembledTrimmedAmplifierSet[_T]:
         """Construct from a detector image and existing views into it, with no
         checking.
@@ -238,6 +328,10 @@ class AssembledTrimmedAmplifierSet(TrimmedAmplifierSet[_T]):
             Additional information describing an observation that is the same
             for all amplifiers in the detector.  See also
             `AmplifierSet.observation_info`.
+        arrays : `AmplifierSetArrays`, optional
+            Already-computed metadata arrays for ``amplifiers`` (see
+            `AmplifierSet.arrays`), e.g. from another set with the same
+            amplifiers.  If `None` (default), they are computed on first use.
 
         Returns
         -------
@@ -245,39 +339,29 @@ class AssembledTrimmedAmplifierSet(TrimmedAmplifierSet[_T]):
             An assembled set of trimmed amplifiers.
         """
         self = cls.__new__(cls)
-        self._detector = detector
-        TrimmedAmplifierSet[_T].__init__(self, amplifiers, observation_info=observation_info)
+        self.detector = detector
+        TrimmedAmplifierSet.__init__(
+            self, amplifiers, is_complete=True, observation_info=observation_info
+        )
+        self._arrays = arrays
         return self
 
-    @property
-    def detector(self) -> ImageSection[_T]:
-        """The full trimmed detector image (`ImageSection`)."""
-        return self._detector
-
     def copy(self) -> AssembledTrimmedAmplifierSet[_T]:
         # Docstring inherited.
-        return AssembledTrimmedAmplifierSet(
-            self._detector.copy(),
-            self,
-            observation_info=self.observation_info,
-        )
+        return self._with_detector(self.detector.copy())
 
     def without_images(self) -> AssembledTrimmedAmplifierSet[None]:
         # Docstring inherited.
-        if self._detector.image is None:
+        if self.detector.image is None:
             return self  # type: ignore
         else:
             return self.from_views(
-                self._detector.without_image(),
-                (amp.without_images() for amp in self),
+                self.detector.without_image(),
+                (amp.without_images() for amp in self._amplifiers),
                 observation_info=self.observation_info,
+                arrays=self._arrays,
             )
 
-    @property
-    def is_complete(self) -> bool:
-        # Docstring inherited.
-        return True
-
     @property
     def trimmed_view(self) -> AssembledTrimmedAmplifierSet[_T]:
         # Docstring inherited; this method only exists to change the return
@@ -316,8 +400,59 @@ class AssembledTrimmedAmplifierSet(TrimmedAmplifierSet[_T]):
             ``self.detector.bbox``.
         """
         if detector is None:
-            return self.without_image()  # type: ignore
+            return self.without_images()  # type: ignore
         else:
-            return AssembledTrimmedAmplifierSet(
-                self._detector.with_new_image(detector), self, observation_info=self.observation_info
-            )
+            return self._with_detector(self.detector.with_new_image(detector))
+
+    def _with_detector(self, detector: ImageSection[_U]) -> AssembledTrimmedAmplifierSet[_U]:
+        """Return a set with the same amplifiers as views into a new detector
+        image with the same bounding box as ``self.detector``.
+        """
+        # Nested amplifiers are already in physical coordinates, so each view
+        # is just a subimage; there is no transform to apply or compose, and
+        # nothing for the regular constructor to check.
+        return self.from_views(
+            detector,
+            [amp._as_detector_view(detector) for amp in self._amplifiers],
+            observation_info=self.observation_info,
+            arrays=self._arrays,
+        )
+
+
+def _assemble_trimmed(
+    amplifiers: Sequence[TrimmedAmplifier[_T]], observation_info: Any
+) -> AssembledTrimmedAmplifierSet[_T]:
+    """Assemble trimmed amplifiers into a new detector image.
+
+    Parameters
+    ----------
+    amplifiers : `Sequence` [ `TrimmedAmplifier` ]
+        All amplifiers for a detector, sorted by amplifier ID.  Must not be
+        empty.
+    observation_info
+        Observation information for the assembled set.
+
+    Returns
+    -------
+    assembled : `AssembledTrimmedAmplifierSet`
+        Set whose amplifiers are views into the new detector image.
+    """
+    detector_bbox, tiled = _tiling_of_outputs(amp.physical_transform for amp in amplifiers)
+    # If the amplifiers cover every detector pixel exactly once (the usual
+    # case), every pixel is about to be assigned, so don't bother zero-filling
+    # it first.
+    template = amplifiers[0].data
+    if tiled:
+        detector = template.make_uninitialized(detector_bbox)
+    else:
+        detector = template.make_empty(detector_bbox)
+    # Flip and place each amplifier's pixels directly into the detector image,
+    # without making a physical-coordinates copy of the amplifier first.
+    detector.assign_many((amp.data, amp.physical_transform) for amp in amplifiers)
+    # Views into the detector image only need amplifier metadata, so there is
+    # no need to strip the amplifier images first.
+    return AssembledTrimmedAmplifierSet.from_views(
+        detector,
+        [amp._as_detector_view(detector) for amp in amplifiers],
+        observation_info=observation_info,
+    )
@@ -23,7 +23,7 @@ from __future__ import annotations
 
 __all__ = ("UntrimmedAmplifier",)
 
-from typing import TypeVar
+from typing import Optional, Tuple, TypeVar
 
 from lsst.geom import Box2I
 
@@ -65,6 +65,34 @@ class UntrimmedAmplifier(Amplifier[_T]):
         coordinates.
     """
 
+    __slots__ = (
+        "amplifier_id",
+        "full",
+        "data",
+        "readout_transform",
+        "raw_detector_transform",
+        "horizontal_overscan_boundary",
+        "vertical_overscan_boundary",
+        "horizontal_prescan_boundary",
+        "_data_bbox",
+        "_data_physical_bbox",
+        "_horizontal_overscan_bbox",
+        "_vertical_overscan_bbox",
+        "_horizontal_prescan_bbox",
+        "_horizontal_overscan_is_at_min",
+        "_vertical_overscan_is_at_min",
+        "_horizontal_prescan_is_at_min",
+        "_trimmed_view",
+    )
+
+    full: ImageSection[_T]
+    """The full untrimmed amplifier image (`ImageSection`)."""
+
+    raw_detector_transform: ImageSectionTransform
+    """Tranform that maps this amplifier into its location in assembled but
+    untrimmed raw detector coordinates (`ImageSectionTransform`).
+    """
+
     def __init__(
         self,
         full: ImageSection[_T],
@@ -81,66 +109,86 @@ class UntrimmedAmplifier(Amplifier[_T]):
         assert readout_transform.input_bbox == full.bbox
         assert raw_detector_transform.input_bbox == full.bbox
         assert full.bbox.contains(data_bbox)
-        self._full = full
-        self._amplifier_id = amplifier_id
-        self._readout_transform = readout_transform
+        self.full = full
+        self.data = full.subimage(data_bbox)
+        self.amplifier_id = amplifier_id
+        self.readout_transform = readout_transform
+        self.raw_detector_transform = raw_detector_transform
+        data_min_x, data_min_y = data_bbox.getMinX(), data_bbox.getMinY()
+        data_max_x, data_max_y = data_bbox.getMaxX(), data_bbox.getMaxY()
+        self._horizontal_overscan_is_at_min = horizontal_overscan_bbox.getMaxX() < data_min_x
+        if self._horizontal_overscan_is_at_min:
+            self.horizontal_overscan_boundary = data_min_x
+        else:
+            assert horizontal_overscan_bbox.getMinX() > data_max_x
+            self.horizontal_overscan_boundary = data_max_x
+        self._vertical_overscan_is_at_min = vertical_overscan_bbox.getMaxY() < data_min_y
+        if self._vertical_overscan_is_at_min:
+            self.vertical_overscan_boundary = data_min_y
+        else:
+            assert vertical_overscan_bbox.getMinY() > data_max_y
+            self.vertical_overscan_boundary = data_max_y
+        self._horizontal_prescan_is_at_min = horizontal_prescan_bbox.getMaxX() < data_min_x
+        if self._horizontal_prescan_is_at_min:
+            self.horizontal_prescan_boundary = data_min_x
+        else:
+            assert horizontal_prescan_bbox.getMinX() > data_max_x
+            self.horizontal_prescan_boundary = data_max_x
         self._data_bbox = data_bbox
         self._data_physical_bbox = data_physical_bbox
         self._horizontal_overscan_bbox = horizontal_overscan_bbox
         self._vertical_overscan_bbox = vertical_overscan_bbox
         self._horizontal_prescan_bbox = horizontal_prescan_bbox
-        self._raw_detector_transform = raw_detector_transform
+        self._trimmed_view: Optional[TrimmedAmplifier[_T]] = None
 
     def copy(self) -> UntrimmedAmplifier[_T]:
         # Docstring inherited.
         return UntrimmedAmplifier(
-            self._full.copy(),
+            self.full.copy(),
             amplifier_id=self.amplifier_id,
-            readout_transform=self._readout_transform,
+            readout_transform=self.readout_transform,
             data_bbox=self._data_bbox,
             data_physical_bbox=self._data_physical_bbox,
             horizontal_overscan_bbox=self._horizontal_overscan_bbox,
             vertical_overscan_bbox=self._vertical_overscan_bbox,
             horizontal_prescan_bbox=self._horizontal_prescan_bbox,
-            raw_detector_transform=self._raw_detector_transform,
+            raw_detector_transform=self.raw_detector_transform,
         )
 
     def without_images(self) -> UntrimmedAmplifier[None]:
         # Docstring inherited.
-        if self._full.image is None:
+        if self.full.image is None:
             return self  # type: ignore
         return UntrimmedAmplifier(
-            self._full.without_image(),
+            self.full.without_image(),
             amplifier_id=self.amplifier_id,
-            readout_transform=self._readout_transform,
+            readout_transform=self.readout_transform,
             data_bbox=self._data_bbox,
             data_physical_bbox=self._data_physical_bbox,
             horizontal_overscan_bbox=self._horizontal_overscan_bbox,
             vertical_overscan_bbox=self._vertical_overscan_bbox,
             horizontal_prescan_bbox=self._horizontal_prescan_bbox,
-            raw_detector_transform=self._raw_detector_transform,
+            raw_detector_transform=self.raw_detector_transform,
         )
 
-    @property
-    def amplifier_id(self) -> int:
-        # Docstring inherited.
-        return self._amplifier_id
-
-    @property
-    def data(self) -> ImageSection[_T]:
-        # Docstring inherited.
-        return self._full.subimage(self._data_bbox)
-
     @property
     def trimmed_view(self) -> TrimmedAmplifier[_T]:
         # Docstring inherited.
+        # Everything the view depends on is fixed at construction, so it is
+        # built on first use and then reused.
+        if self._trimmed_view is None:
+            self._trimmed_view = self._make_trimmed_view()
+        return self._trimmed_view
+
+    def _make_trimmed_view(self) -> TrimmedAmplifier[_T]:
+        """Construct the value of `trimmed_view`."""
         return TrimmedAmplifier(
             self.data,
             amplifier_id=self.amplifier_id,
-            readout_transform=self._readout_transform.for_subimage(self._data_bbox),
-            horizontal_overscan_is_at_min=(self.horizontal_overscan_boundary == self._data_bbox.getMinX()),
-            vertical_overscan_is_at_min=(self.vertical_overscan_boundary == self._data_bbox.getMinY()),
-            horizontal_prescan_is_at_min=(self.horizontal_prescan_boundary == self._data_bbox.getMinX()),
+            readout_transform=self.readout_transform.for_subimage(self._data_bbox),
+            horizontal_overscan_is_at_min=self._horizontal_overscan_is_at_min,
+            vertical_overscan_is_at_min=self._vertical_overscan_is_at_min,
+            horizontal_prescan_is_at_min=self._horizontal_prescan_is_at_min,
             # Physical coordinates for trimmed amp always has the same
             # orientation as the raw detector coordinates, but with different
             # offsets.
@@ -152,58 +200,80 @@ class UntrimmedAmplifier(Amplifier[_T]):
             ),
         )
 
-    @property
-    def readout_transform(self) -> ImageSectionTransform:
-        # Docstring inherited.
-        return self._readout_transform
-
     def into_readout_coordinates(self, *, allow_view: bool = False) -> UntrimmedAmplifier[_T]:
         # Docstring inherited.
-        new_full = self._full.apply_transform(self._readout_transform, allow_view=allow_view)
+        new_full = self.full.apply_transform(self.readout_transform, allow_view=allow_view)
+        (
+            data_bbox,
+            horizontal_overscan_bbox,
+            vertical_overscan_bbox,
+            horizontal_prescan_bbox,
+        ) = self.readout_transform._map_subimage_bboxes(self._region_bboxes())
         return UntrimmedAmplifier(
             new_full,
             amplifier_id=self.amplifier_id,
             readout_transform=ImageSectionTransform.make_identity(new_full.bbox),
-            data_bbox=self._readout_transform.for_subimage(self._data_bbox).output_bbox,
+            data_bbox=data_bbox,
             data_physical_bbox=self._data_physical_bbox,
-            horizontal_overscan_bbox=self._readout_transform.for_subimage(
-                self._horizontal_overscan_bbox
-            ).output_bbox,
-            vertical_overscan_bbox=self._readout_transform.for_subimage(
-                self._vertical_overscan_bbox
-            ).output_bbox,
-            horizontal_prescan_bbox=self._readout_transform.for_subimage(
-                self._horizontal_prescan_bbox
-            ).output_bbox,
-            raw_detector_transform=self.raw_detector_transform.after(self._readout_transform),
+            horizontal_overscan_bbox=horizontal_overscan_bbox,
+            vertical_overscan_bbox=vertical_overscan_bbox,
+            horizontal_prescan_bbox=horizontal_prescan_bbox,
+            raw_detector_transform=self.raw_detector_transform.after(self.readout_transform.inverse()),
         )
 
-    @property
-    def horizontal_overscan_boundary(self) -> int:
-        # Docstring inherited.
-        if self._horizontal_overscan_bbox.getMaxX() < self._data_bbox.getMinX():
-            return self._data_bbox.getMinX()
-        else:
-            assert self._horizontal_overscan_bbox.getMinX() > self._data_bbox.getMaxX()
-            return self._data_bbox.getMaxX()
+    def _as_detector_view(self, detector: ImageSection[_U]) -> UntrimmedAmplifier[_U]:
+        """Return a version of this amplifier in raw detector coordinates
+        whose full image is a subimage of the given detector image.
 
-    @property
-    def vertical_overscan_boundary(self) -> int:
-        # Docstring inherited.
-        if self._vertical_overscan_bbox.getMaxY() < self._data_bbox.getMinY():
-            return self._data_bbox.getMinY()
-        else:
-            assert self._vertical_overscan_bbox.getMinY() > self._data_bbox.getMaxY()
-            return self._data_bbox.getMaxY()
+        Parameters
+        ----------
+        detector : `ImageSection`
+            Full-detector image section in raw detector coordinates; must
+            contain ``self.raw_detector_transform.output_bbox``.
 
-    @property
-    def horizontal_prescan_boundary(self) -> int:
-        # Docstring inherited.
-        if self._horizontal_prescan_bbox.getMaxX() < self._data_bbox.getMinX():
-            return self._data_bbox.getMinX()
+        Returns
+        -------
+        amplifier : `UntrimmedAmplifier`
+            Amplifier whose full image is a view into ``detector``.  Any image
+            in ``self.full`` is ignored.
+        """
+        # This is equivalent to into_raw_detector_coordinates followed by
+        # with_new_full_image, without transforming self.full or wrapping a
+        # bare image again.
+        transform = self.raw_detector_transform
+        new_full = detector.subimage(transform.output_bbox)
+        if transform.is_identity:
+            readout_transform = self.readout_transform
+            raw_detector_transform = transform
+            region_bboxes = self._region_bboxes()
         else:
-            assert self._horizontal_prescan_bbox.getMinX() > self._data_bbox.getMaxX()
-            return self._data_bbox.getMaxX()
+            readout_transform = self.readout_transform.after(transform.inverse())
+            raw_detector_transform = ImageSectionTransform.make_identity(new_full.bbox)
+            region_bboxes = transform._map_subimage_bboxes(self._region_bboxes())
+        data_bbox, horizontal_overscan_bbox, vertical_overscan_bbox, horizontal_prescan_bbox = region_bboxes
+        return UntrimmedAmplifier(
+            new_full,
+            amplifier_id=self.amplifier_id,
+            readout_transform=readout_transform,
+            data_bbox=data_bbox,
+            data_physical_bbox=self._data_physical_bbox,
+            horizontal_overscan_bbox=horizontal_overscan_bbox,
+            vertical_overscan_bbox=vertical_overscan_bbox,
+            horizontal_prescan_bbox=horizontal_prescan_bbox,
+            raw_detector_transform=raw_detector_transform,
+        )
+
+    def _region_bboxes(self) -> Tuple[Box2I, Box2I, Box2I, Box2I]:
+        """Return the bounding boxes of the data, horizontal overscan,
+        vertical overscan, and horizontal prescan regions, for mapping to new
+        coordinates all at once.
+        """
+        return (
+            self._data_bbox,
+            self._horizontal_overscan_bbox,
+            self._vertical_overscan_bbox,
+            self._horizontal_prescan_bbox,
+        )
 
     @property
     def horizontal_overscan(self) -> ImageSection[_T]:
@@ -212,7 +282,7 @@ class UntrimmedAmplifier(Amplifier[_T]):
 
         Guaranteed to be a view that shares pixels with ``self``.
         """
-        return self._full.subimage(self._horizontal_overscan_bbox)
+        return self.full.subimage(self._horizontal_overscan_bbox)
 
     @property
     def vertical_overscan(self) -> ImageSection[_T]:
@@ -221,7 +291,7 @@ class UntrimmedAmplifier(Amplifier[_T]):
 
         Guaranteed to be a view that shares pixels with ``self``.
         """
-        return self._full.subimage(self._vertical_overscan_bbox)
+        return self.full.subimage(self._vertical_overscan_bbox)
 
     @property
     def horizontal_prescan(self) -> ImageSection[_T]:
@@ -230,12 +300,7 @@ class UntrimmedAmplifier(Amplifier[_T]):
 
         Guaranteed to be a view that shares pixels with ``self``.
         """
-        return self._full.subimage(self._horizontal_prescan_bbox)
-
-    @property
-    def full(self) -> ImageSection[_T]:
-        """The full untrimmed amplifier image (`ImageSection`)."""
-        return self._full
+        return self.full.subimage(self._horizontal_prescan_bbox)
 
     def with_new_full_image(self, image: _U) -> UntrimmedAmplifier[_U]:
         """Return a version of this amplifier with the given full image
@@ -262,26 +327,19 @@ class UntrimmedAmplifier(Amplifier[_T]):
             Raised if the given image's bounding box is not consistent with
             ``self.detector.bbox``.
         """
-        new_full = self._full.with_new_image(image)
+        new_full = self.full.with_new_image(image)
         return UntrimmedAmplifier(
             new_full,
             amplifier_id=self.amplifier_id,
-            readout_transform=self._readout_transform,
+            readout_transform=self.readout_transform,
             data_bbox=self._data_bbox,
             data_physical_bbox=self._data_physical_bbox,
             horizontal_overscan_bbox=self._horizontal_overscan_bbox,
             vertical_overscan_bbox=self._vertical_overscan_bbox,
             horizontal_prescan_bbox=self._horizontal_prescan_bbox,
-            raw_detector_transform=self._raw_detector_transform,
+            raw_detector_transform=self.raw_detector_transform,
         )
 
-    @property
-    def raw_detector_transform(self) -> ImageSectionTransform:
-        """Tranform that maps this amplifier into its location in assembled
-        but untrimmed raw detector coordinates (`ImageSectionTransform`).
-        """
-        return self._raw_detector_transform
-
     def into_raw_detector_coordinates(self, *, allow_view: bool = False) -> UntrimmedAmplifier[_T]:
         """Return a new `Amplifier` with the same trim state that is guaranteed
         to satisfy ``self.raw_detector_transform.is_identity``.
@@ -300,21 +358,21 @@ class UntrimmedAmplifier(Amplifier[_T]):
         amplifier : `UntrimmedAmplifer`
             Amplifier in raw detector coordinates.
         """
-        new_full = self._full.apply_transform(self.raw_detector_transform, allow_view=allow_view)
+        new_full = self.full.apply_transform(self.raw_detector_transform, allow_view=allow_view)
+        (
+            data_bbox,
+            horizontal_overscan_bbox,
+            vertical_overscan_bbox,
+            horizontal_prescan_bbox,
+        ) = self.raw_detector_transform._map_subimage_bboxes(self._region_bboxes())
         return UntrimmedAmplifier(
             new_full,
             amplifier_id=self.amplifier_id,
-            readout_transform=self._readout_transform.after(self.raw_detector_transform),
-            data_bbox=self.raw_detector_transform.for_subimage(self._data_bbox).output_bbox,
+            readout_transform=self.readout_transform.after(self.raw_detector_transform.inverse()),
+            data_bbox=data_bbox,
             data_physical_bbox=self._data_physical_bbox,
-            horizontal_overscan_bbox=self.raw_detector_transform.for_subimage(
-                self._horizontal_overscan_bbox
-            ).output_bbox,
-            vertical_overscan_bbox=self.raw_detector_transform.for_subimage(
-                self._vertical_overscan_bbox
-            ).output_bbox,
-            horizontal_prescan_bbox=self.raw_detector_transform.for_subimage(
-                self._horizontal_prescan_bbox
-            ).output_bbox,
+            horizontal_overscan_bbox=horizontal_overscan_bbox,
+            vertical_overscan_bbox=vertical_overscan_bbox,
+            horizontal_prescan_bbox=horizontal_prescan_bbox,
             raw_detector_transform=ImageSectionTransform.make_identity(new_full.bbox),
         )
@@ -27,17 +27,22 @@ __all__ = (
 )
 
 from abc import abstractmethod
-from typing import Any, Iterable, Iterator, List, TypeVar
+from typing import Any, Iterable, Iterator, Optional, Tuple, TypeVar
 
-from lsst.geom import Box2I
-
-from ._image_section import ImageSection
+from ._image_section import ImageSection, _tiling_of_outputs
 from ._untrimmed_amplifier import UntrimmedAmplifier
-from ._amplifier_set import AmplifierSet, IncompleteAmplifierSetError
+from ._amplifier_set import (
+    AmplifierSet,
+    AmplifierSetArrays,
+    IncompleteAmplifierSetError,
+    _find_amplifier,
+    _sort_amplifiers,
+)
 from ._trimmed_amplifier_sets import (
     AssembledTrimmedAmplifierSet,
     TrimmedAmplifierSet,
     UnassembledTrimmedAmplifierSet,
+    _assemble_trimmed,
 )
 
 _T = TypeVar("_T")
@@ -55,48 +60,65 @@ class UntrimmedAmplifierSet(AmplifierSet[_T]):
     amplifiers : `Iterable` [ `UntrimmedAmplifier` ]
         An iterable of `UntrimmedAmplifer` objects to include in the set.
         Iterators and single-pass iterators are permitted.  Must be from the
-        same detector, and have the same image type.
+        same detector, have the same image type, and have unique amplifier
+        IDs.  The set iterates over them in order of amplifier ID.
+    is_complete : `bool`
+        Whether all amplifiers for the detector are included.
     observation_info, optional
         Additional information describing an observation that is the same for
         all amplifiers in the detector.  See also
         `AmplifierSet.observation_info`.
     """
 
+    __slots__ = ("_amplifiers", "_ids", "_id_offset", "observation_info", "is_complete", "_trimmed_view")
+
     def __init__(
         self,
         amplifiers: Iterable[UntrimmedAmplifier[_T]],
         *,
+        is_complete: bool,
         observation_info: Any = None,
     ):
-        self._mapping = {amp.amplifier_id: amp for amp in amplifiers}
-        self._observation_info = observation_info
+        # See TrimmedAmplifierSet.__init__ for why this isn't a dict.
+        self._amplifiers, self._ids, self._id_offset = _sort_amplifiers(amplifiers)
+        self.is_complete = is_complete
+        self.observation_info = observation_info
+        self._arrays = None
+        self._trimmed_view: Optional[TrimmedAmplifierSet[_T]] = None
 
     def __getitem__(self, amplifier_id: int) -> UntrimmedAmplifier[_T]:
-        return self._mapping[amplifier_id]
+        return _find_amplifier(self._amplifiers, self._ids, self._id_offset, amplifier_id)
 
     def __iter__(self) -> Iterator[UntrimmedAmplifier[_T]]:
-        return iter(self._mapping.values())
+        return iter(self._amplifiers)
 
     def __len__(self) -> int:
-        return len(self._mapping)
-
-    @property
-    def observation_info(self) -> Any:
-        # Docstring inherited.
-        return self._observation_info
+        return len(self._amplifiers)
 
     @property
     def trimmed_view(self) -> TrimmedAmplifierSet[_T]:
         # Docstring inherited.
-        return UnassembledTrimmedAmplifierSet(
-            (amp.trimmed_view for amp in self),
-            is_complete=self.is_complete,
-            observation_info=self.observation_info,
-        )
+        # Sets and the amplifiers in them are immutable, so the view is built
+        # on first use and then reused.
+        if self._trimmed_view is None:
+            # Trimming doesn't change amplifier IDs, so the trimmed views are
+            # already sorted.
+            self._trimmed_view = UnassembledTrimmedAmplifierSet._from_sorted(
+                tuple([amp.trimmed_view for amp in self._amplifiers]),
+                self._ids,
+                self._id_offset,
+                is_complete=self.is_complete,
+                observation_info=self.observation_info,
+            )
+        return self._trimmed_view
 
     def assemble_into_trimmed(self, *, allow_view: bool = False) -> AssembledTrimmedAmplifierSet[_T]:
         # Docstring inherited.
-        return self.trimmed_view.assemble_into_trimmed(allow_view=allow_view)
+        if not (self.is_complete and self._amplifiers):
+            raise IncompleteAmplifierSetError()
+        # Assemble the amplifiers' trimmed views directly, rather than making
+        # a trimmed set just to assemble it.
+        return _assemble_trimmed([amp.trimmed_view for amp in self._amplifiers], self.observation_info)
 
     @abstractmethod
     def copy(self) -> UntrimmedAmplifierSet[_T]:
@@ -111,7 +133,9 @@ class UntrimmedAmplifierSet(AmplifierSet[_T]):
         raise NotImplementedError()
 
     @abstractmethod
-    def assemble_into_untrimmed(self, *, allow_view: bool = False) -> AssembledUntrimmedAmplifierSet[_T]:
+    def assemble_into_untrimmed(
+        self, *, allow_view: bool = False, out: Optional[ImageSection[_T]] = None
+    ) -> AssembledUntrimmedAmplifierSet[_T]:
         """Assemble these amplifiers into a single untrimmed image.
 
         Parameters
@@ -121,17 +145,26 @@ class UntrimmedAmplifierSet(AmplifierSet[_T]):
             with ``self``; in this case it may even be ``self``.  This is
             disabled by default because a copy is required in the general case,
             so code that implicitly assumes a (partial) view is returned
-            probably isn't instrument-generic.
+            probably isn't instrument-generic.  Ignored if ``out`` is provided.
+        out : `ImageSection`, optional
+            Existing detector image to assemble into, for reusing the same
+            buffer across many calls.  Must have the same bounding box as the
+            assembled detector and the same image type as the amplifiers.
+            Pixels that are not part of any amplifier are left unchanged.  If
+            `None` (default), a new detector image is allocated.
 
         Returns
         -------
         amplifiers : `AssembledUntrimmedAmplifierSet`
-            An assembled amplifer set.
+            An assembled amplifer set.  If ``out`` was provided, it is the
+            ``detector`` of this set.
 
         Raises
         ------
         IncompleteAmplifierSetError
             Raised if `is_complete` is `False`.
+        ValueError
+            Raised if ``out`` has the wrong bounding box.
         """
         raise NotImplementedError()
 
@@ -153,63 +186,121 @@ class UnassembledUntrimmedAmplifierSet(UntrimmedAmplifierSet[_T]):
         `AmplifierSet.observation_info`.
     """
 
+    __slots__ = ("_in_readout_coordinates",)
+
     def __init__(
         self, amplifiers: Iterable[UntrimmedAmplifier[_T]], is_complete: bool, *, observation_info: Any = None
     ):
         super().__init__(
             amplifiers,
+            is_complete=is_complete,
             observation_info=observation_info,
         )
-        self._is_complete = is_complete
+        # Whether all amplifiers have identity readout transforms; computed on
+        # first use, or passed along by methods that already know it.
+        self._in_readout_coordinates: Optional[bool] = None
+
+    def _is_in_readout_coordinates(self) -> bool:
+        """Return whether all amplifiers are already in readout coordinates.
+        """
+        if self._in_readout_coordinates is None:
+            self._in_readout_coordinates = all(amp.readout_transform.is_identity for amp in self._amplifiers)
+        return self._in_readout_coordinates
+
+    def _derived(
+        self,
+        amplifiers: Tuple[UntrimmedAmplifier[_U], ...],
+        *,
+        in_readout_coordinates: Optional[bool] = None,
+        arrays: Optional[AmplifierSetArrays] = None,
+    ) -> UnassembledUntrimmedAmplifierSet[_U]:
+        """Return a new set with the same flags and observation information
+        as ``self``, holding the given amplifiers.
+
+        Parameters
+        ----------
+        amplifiers : `tuple` [ `UntrimmedAmplifier` ]
+            Amplifiers derived from those in ``self``, in the same order and
+            with the same IDs.  This is not checked.
+        in_readout_coordinates : `bool`, optional
+            Whether all of ``amplifiers`` are in readout coordinates, if known.
+        arrays : `AmplifierSetArrays`, optional
+            Already-computed metadata arrays for ``amplifiers``, if any.
+        """
+        # Skip the constructor: the amplifiers are already in order and their
+        # IDs already known to be unique.
+        result = UnassembledUntrimmedAmplifierSet.__new__(UnassembledUntrimmedAmplifierSet)
+        result._amplifiers = amplifiers
+        result._ids = self._ids
+        result._id_offset = self._id_offset
+        result.is_complete = self.is_complete
+        result.observation_info = self.observation_info
+        result._arrays = arrays
+        result._trimmed_view = None
+        result._in_readout_coordinates = in_readout_coordinates
+        return result
 
     def copy(self) -> UntrimmedAmplifierSet[_T]:
         # Docstring inherited.
-        return UnassembledUntrimmedAmplifierSet(
-            (amp.copy() for amp in self),
-            is_complete=self._is_complete,
-            observation_info=self.observation_info,
+        # Copies and image-less versions have the same metadata.
+        return self._derived(
+            tuple([amp.copy() for amp in self._amplifiers]),
+            in_readout_coordinates=self._in_readout_coordinates,
+            arrays=self._arrays,
         )
 
     def without_images(self) -> UntrimmedAmplifierSet[None]:
         # Docstring inherited.
-        return UnassembledUntrimmedAmplifierSet(
-            (amp.without_images() for amp in self),
-            is_complete=self._is_complete,
-            observation_info=self.observation_info,
+        # Amplifiers in a set have the same image type, so this normally
+        # stops at the first one.
+        if all(amp.full.image is None for amp in self._amplifiers):
+            return self  # type: ignore
+        return self._derived(
+            tuple([amp.without_images() for amp in self._amplifiers]),
+            in_readout_coordinates=self._in_readout_coordinates,
+            arrays=self._arrays,
         )
 
-    @property
-    def is_complete(self) -> bool:
-        # Docstring inherited.
-        return self._is_complete
-
     def into_readout_coordinates(self, *, allow_view: bool = False) -> UntrimmedAmplifierSet[_T]:
         # Docstring inherited.
-        if allow_view and all(amp.readout_transform.is_identity for amp in self):
+        # Without allow_view every amplifier must be copied anyway, so only
+        # check for the no-op case when it could matter.
+        if allow_view and self._is_in_readout_coordinates():
             return self
-        return UnassembledUntrimmedAmplifierSet(
-            (amp.into_readout_coordinates(allow_view=allow_view) for amp in self),
-            is_complete=self._is_complete,
-            observation_info=self.observation_info,
+        return self._derived(
+            tuple([amp.into_readout_coordinates(allow_view=allow_view) for amp in self._amplifiers]),
+            in_readout_coordinates=True,
         )
 
-    def assemble_into_untrimmed(self, *, allow_view: bool = False) -> AssembledUntrimmedAmplifierSet[_T]:
+    def assemble_into_untrimmed(
+        self, *, allow_view: bool = False, out: Optional[ImageSection[_T]] = None
+    ) -> AssembledUntrimmedAmplifierSet[_T]:
         # Docstring inherited.
-        if not self.is_complete or not self:
+        if not (self.is_complete and self._amplifiers):
             raise IncompleteAmplifierSetError()
-        detector_bbox = Box2I()
-        for amp in self:
-            detector_bbox.include(amp.raw_detector_transform.output_bbox)
-        # amp is guaranteed to be bound because we tested for 'not self' above.
-        detector = amp.data.make_empty(detector_bbox)  # type: ignore
-        new_amplifiers: List[UntrimmedAmplifier[_T]] = []
-        for amp in self:
-            new_amp = amp.into_raw_detector_coordinates(allow_view=True)
-            detector.assign(new_amp.data)
-            new_amplifiers.append(new_amp)
-        return AssembledUntrimmedAmplifierSet(
+        detector_bbox, tiled = _tiling_of_outputs(amp.raw_detector_transform for amp in self._amplifiers)
+        if out is None:
+            # There is at least one amplifier because we tested for that
+            # above.  Untrimmed amplifiers normally cover every detector pixel
+            # exactly once, in which case there's no need to zero-fill it.
+            template = self._amplifiers[0].full
+            if tiled:
+                detector = template.make_uninitialized(detector_bbox)
+            else:
+                detector = template.make_empty(detector_bbox)
+        elif out.bbox != detector_bbox:
+            raise ValueError(f"Output detector has bbox {out.bbox}, not {detector_bbox}.")
+        else:
+            detector = out
+        # Flip and place each amplifier's pixels directly into the detector
+        # image, without making a raw-detector-coordinates copy of the
+        # amplifier first.
+        detector.assign_many((amp.full, amp.raw_detector_transform) for amp in self._amplifiers)
+        # Views into the detector image only need amplifier metadata, so there
+        # is no need to strip the amplifier images first.
+        return AssembledUntrimmedAmplifierSet.from_views(
             detector,
-            new_amplifiers,
+            [amp._as_detector_view(detector) for amp in self._amplifiers],
             observation_info=self.observation_info,
         )
 
@@ -243,6 +334,11 @@ class AssembledUntrimmedAmplifierSet(UntrimmedAmplifierSet[_T]):
         `AmplifierSet.observation_info`.
     """
 
+    __slots__ = ("detector",)
+
+    detector: ImageSection[_T]
+    """The full untrimmed detector image (`ImageSection`)."""
+
     def __init__(
         self,
         detector: ImageSection[_T],
@@ -250,13 +346,10 @@ class AssembledUntrimmedAmplifierSet(UntrimmedAmplifierSet[_T]):
         *,
         observation_info: Any = None,
     ):
-        self._detector = detector
-        raw_detector_amplifiers = (amp.into_raw_detector_coordinates(allow_view=True) for amp in amplifiers)
+        self.detector = detector
         super().__init__(
-            (
-                amp.with_new_full_image(detector.subimage(amp.full.bbox).image)
-                for amp in raw_detector_amplifiers
-            ),
+            [amp._as_detector_view(detector) for amp in amplifiers],
+            is_complete=True,
             observation_info=observation_info,
         )
 
@@ -267,6 +360,7 @@ class AssembledUntrimmedAmplifierSet(UntrimmedAmplifierSet[_T]):
         amplifiers: Iterable[UntrimmedAmplifier[_T]],
         *,
         observation_info: Any = None,
+        arrays: Optional[AmplifierSetArrays] = None,
     ) -> AssembledUntrimmedAmplifierSet[_T]:
         """Construct from a detector image and existing views into it, with no
         checking.
@@ -289,6 +383,10 @@ class AssembledUntrimmedAmplifierSet(UntrimmedAmplifierSet[_T]):
             Additional information describing an observation that is the same
             for all amplifiers in the detector.  See also
             `AmplifierSet.observation_info`.
+        arrays : `AmplifierSetArrays`, optional
+            Already-computed metadata arrays for ``amplifiers`` (see
+            `AmplifierSet.arrays`), e.g. from another set with the same
+            amplifiers.  If `None` (default), they are computed on first use.
 
         Returns
         -------
@@ -296,45 +394,40 @@ class AssembledUntrimmedAmplifierSet(UntrimmedAmplifierSet[_T]):
             An assembled set of untrimmed amplifiers.
         """
         self = cls.__new__(cls)
-        self._detector = detector
-        UntrimmedAmplifierSet[_T].__init__(self, amplifiers, observation_info=observation_info)
+        self.detector = detector
+        UntrimmedAmplifierSet.__init__(
+            self, amplifiers, is_complete=True, observation_info=observation_info
+        )
+        self._arrays = arrays
         return self
 
-    @property
-    def detector(self) -> ImageSection[_T]:
-        """The full untrimmed detector image (`ImageSection`)."""
-        return self._detector
-
-    @abstractmethod
     def copy(self) -> AssembledUntrimmedAmplifierSet[_T]:
         # Docstring inherited.
-        return AssembledUntrimmedAmplifierSet(
-            self._detector.copy(),
-            self,
-            observation_info=self.observation_info,
-        )
+        return self._with_detector(self.detector.copy())
 
-    @abstractmethod
     def without_images(self) -> AssembledUntrimmedAmplifierSet[None]:
         # Docstring inherited.
-        if self._detector.image is None:
+        if self.detector.image is None:
             return self  # type: ignore
         else:
             return self.from_views(
-                self._detector.without_image(),
-                (amp.without_images() for amp in self),
+                self.detector.without_image(),
+                [amp.without_images() for amp in self._amplifiers],
                 observation_info=self.observation_info,
+                arrays=self._arrays,
             )
 
-    @property
-    def is_complete(self) -> bool:
-        # Docstring inherited.
-        return True
-
-    def assemble_into_untrimmed(self, *, allow_view: bool = False) -> AssembledUntrimmedAmplifierSet[_T]:
+    def assemble_into_untrimmed(
+        self, *, allow_view: bool = False, out: Optional[ImageSection[_T]] = None
+    ) -> AssembledUntrimmedAmplifierSet[_T]:
         # Docstring inherited; this method only exists to change the return
         # type (covariantly) and provide a default implementation.
-        return self if allow_view else self.copy()
+        if out is None:
+            return self if allow_view else self.copy()
+        if out.bbox != self.detector.bbox:
+            raise ValueError(f"Output detector has bbox {out.bbox}, not {self.detector.bbox}.")
+        out.assign(self.detector)
+        return self._with_detector(out)
 
     def with_new_detector_image(self, detector: _U) -> AssembledUntrimmedAmplifierSet[_U]:
         """Return an `AssembledUntrimmedAmplifierSet` with the same bounding
@@ -364,10 +457,20 @@ class AssembledUntrimmedAmplifierSet(UntrimmedAmplifierSet[_T]):
             ``self.detector.bbox``.
         """
         if detector is None:
-            return self.without_image()  # type: ignore
+            return self.without_images()  # type: ignore
         else:
-            return AssembledUntrimmedAmplifierSet(
-                self._detector.with_new_image(detector),
-                self,
-                observation_info=self.observation_info,
-            )
+            return self._with_detector(self.detector.with_new_image(detector))
+
+    def _with_detector(self, detector: ImageSection[_U]) -> AssembledUntrimmedAmplifierSet[_U]:
+        """Return a set with the same amplifiers as views into a new detector
+        image with the same bounding box as ``self.detector``.
+        """
+        # Nested amplifiers are already in raw detector coordinates, so each
+        # view is just a subimage; there is no transform to apply or compose,
+        # and nothing for the regular constructor to check.
+        return self.from_views(
+            detector,
+            [amp._as_detector_view(detector) for amp in self._amplifiers],
+            observation_info=self.observation_info,
+            arrays=self._arrays,
+        )